@@ -11,6 +11,10 @@ class Config:
     COMFYUI_HOST = "127.0.0.1"
     COMFYUI_PORT = 8188
     COMFYUI_URL = f"http://{COMFYUI_HOST}:{COMFYUI_PORT}"
+    # 多个ComfyUI后端地址（逗号分隔），视频生成时并行分发任务
+    COMFYUI_URLS = os.getenv("COMFYUI_URLS", COMFYUI_URL).split(",")
+    # 本机ComfyUI的output目录
+    COMFYUI_OUTPUT_DIR = Path(os.getenv("COMFYUI_OUTPUT_DIR", "F:/ComfyUI_windows_portable/ComfyUI/output"))
     
     # TTS配置
     TTS_HOST = "127.0.0.1"
@@ -28,6 +32,11 @@ class Config:
     AUDIO_DIR = BASE_DIR / "outputs" / "audio"
     FINAL_VIDEO_DIR = BASE_DIR / "outputs" / "final_videos"
     
+    # 图片转视频结果缓存目录（按图片内容哈希命名）
+    IMAGE_CLIP_CACHE_DIR = TEMP_DIR / "image_clip_cache"
+    IMAGE_CLIP_CACHE_MAX_FILES = int(os.getenv("IMAGE_CLIP_CACHE_MAX_FILES", "200"))  # 缓存最多保留的视频数
+    IMAGE_CLIP_CACHE_MAX_MB = int(os.getenv("IMAGE_CLIP_CACHE_MAX_MB", "1024"))  # 缓存总大小上限（MB）
+    
     # 工作流文件路径
     IMAGE_WORKFLOW = WORKFLOWS_DIR / "双节棍nunchaku-flux.1-schnell文生图工作流api.json"
     VIDEO_WORKFLOW = WORKFLOWS_DIR / "▶Wan2.2-AllInOne图生视频流.json"
@@ -44,6 +53,8 @@ class Config:
     DEFAULT_VIDEO_DURATION = 5  # 秒
     DEFAULT_VIDEO_FPS = 30
     DEFAULT_VIDEO_QUALITY = "medium"
+    X264_CRF = int(os.getenv("X264_CRF", "19"))  # libx264转码质量（越小质量越高）
+    X264_PRESET = os.getenv("X264_PRESET", "ultrafast")  # libx264编码预设（越快压缩率越低）
     
     # 支持的文件格式
     SUPPORTED_IMAGE_FORMATS = ['.jpg', '.jpeg', '.png', '.bmp', '.webp']
@@ -5,6 +5,8 @@ AI视频生成器 - 完整版本
 
 import streamlit as st
 import json
+import logging
+import sys
 import time
 import os
 from pathlib import Path
@@ -22,6 +24,10 @@ except ImportError as e:
     st.error(f"导入服务模块失败: {e}")
     st.stop()
 
+# 服务模块通过logging输出运行日志，在入口统一输出到控制台
+logging.basicConfig(format='%(message)s', stream=sys.stdout)
+logging.getLogger('services').setLevel(logging.INFO)
+
 # 页面配置
 st.set_page_config(
     page_title="AI视频生成器",
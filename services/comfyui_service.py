@@ -1,18 +1,34 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 try:
     import websocket
 except ImportError:
     print("Warning: websocket-client not installed. Some features may not work.")
     websocket = None
 import json
+import logging
+import os
+import sys
+import shutil
+import subprocess
 import uuid
 import time
 import threading
+import traceback
+from fractions import Fraction
+from functools import lru_cache
+import queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional
 from pathlib import Path
 import base64
 from config import Config
+from .output_watcher import get_output_watcher
 import gc
+import hashlib
+import heapq
 
 # 尝试导入psutil，如果失败则设置为None
 try:
@@ -21,6 +37,276 @@ except ImportError:
     psutil = None
     print("Warning: psutil not installed. System resource monitoring will be disabled.")
 
+# 优先使用orjson编解码工作流JSON，未安装时回退到标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Pillow用于检查GIF帧数和绘制占位符图片，未安装时所有GIF都走FFmpeg转码
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:
+    Image = ImageDraw = ImageFont = None
+
+# PyAV用于FFmpeg命令行不可用时在进程内转码GIF
+try:
+    import av
+except ImportError:
+    av = None
+
+# xxhash计算文件内容哈希远快于hashlib，未安装时回退到blake2b
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+# 日志的输出位置和级别由应用入口配置
+logger = logging.getLogger(__name__)
+
+
+# ComfyUI输出文件的扩展名（小写），用于O(1)的成员判断
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv'})
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.webp'})
+
+
+# FFmpeg可执行文件路径只在导入时查找一次，避免每次启动子进程都遍历PATH
+_FFMPEG_BIN = shutil.which('ffmpeg') or 'ffmpeg'
+
+# 按优先顺序探测的H.264硬件编码器及其FFmpeg参数（QSV只接受nv12输入）
+_HW_H264_ENCODERS = [
+    ('h264_nvenc', ('-c:v', 'h264_nvenc', '-pix_fmt', 'yuv420p')),
+    ('h264_qsv', ('-c:v', 'h264_qsv', '-pix_fmt', 'nv12')),
+    ('h264_videotoolbox', ('-c:v', 'h264_videotoolbox', '-pix_fmt', 'yuv420p')),
+]
+_LIBX264_ARGS = ('-c:v', 'libx264', '-pix_fmt', 'yuv420p')
+
+# yuv420p要求宽高为偶数；奇数尺寸向下取偶，与像素格式转换在同一次swscale中完成，偶数尺寸时不做缩放
+_EVEN_SIZE_FILTER = ('-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2')
+
+
+@lru_cache(maxsize=1)
+def _h264_encoder_args() -> tuple:
+    """探测本机可用的H.264编码器（进程内只探测一次），返回FFmpeg编码参数，没有硬件编码器时使用libx264"""
+    for name, args in _HW_H264_ENCODERS:
+        # 编译了编码器不代表有对应的显卡，用一段极短的测试编码确认可用
+        cmd = [_FFMPEG_BIN, '-hide_banner', '-loglevel', 'error',
+               '-f', 'lavfi', '-i', 'color=c=black:s=256x256:d=0.1',
+               *args, '-f', 'null', '-']
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=15)
+        except (OSError, subprocess.TimeoutExpired):
+            break
+        if result.returncode == 0:
+            logger.info("🎞️ 使用硬件编码器: %s", name)
+            return args
+    return _LIBX264_ARGS
+
+
+def _h264_output_args(tune: Optional[str] = None, crf: Optional[int] = None) -> list:
+    """生成H.264编码参数；指定crf时各编码器都按恒定质量编码，回退到libx264时使用配置的预设（默认ultrafast）并用满所有CPU核心"""
+    args = list(_h264_encoder_args())
+    encoder = args[1]
+    if encoder == 'libx264':
+        args += ['-preset', Config.X264_PRESET, '-threads', '0']
+        if tune:
+            args += ['-tune', tune]
+        if crf is not None:
+            args += ['-crf', str(crf)]
+    elif encoder == 'h264_nvenc':
+        # 静态图片片段内容不变，用最快的p1预设和超低延迟调优；动图保持默认预设
+        if tune == 'stillimage':
+            args += ['-preset', 'p1', '-tune', 'ull']
+        if crf is not None:
+            args += ['-rc', 'vbr', '-cq', str(crf), '-b:v', '0']
+    elif encoder == 'h264_qsv':
+        if crf is not None:
+            args += ['-global_quality', str(crf)]
+    return args
+
+
+def _json_dumps(obj, pretty: bool = False) -> bytes:
+    """将对象序列化为UTF-8编码的JSON字节串"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data):
+    """解析JSON字节串或字符串"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Linux下以较低的CPU/IO优先级运行FFmpeg，避免转码占满CPU拖慢同进程的Web服务
+_FFMPEG_NICE_PREFIX = []
+if sys.platform.startswith('linux'):
+    _nice_bin = shutil.which('nice')
+    _ionice_bin = shutil.which('ionice')
+    if _nice_bin:
+        _FFMPEG_NICE_PREFIX += [_nice_bin, '-n', '10']
+    if _ionice_bin:
+        _FFMPEG_NICE_PREFIX += [_ionice_bin, '-c', '2', '-n', '7']
+
+# 字节数换算为MB的系数
+_MB = 1 / 1048576
+
+# 已确认存在的输出目录，避免每个文件都重复执行mkdir
+_DIRS_READY = set()
+
+
+def _ensure_dir(directory: Path):
+    """确保目录存在，同一目录在进程内只创建一次"""
+    if directory not in _DIRS_READY:
+        directory.mkdir(parents=True, exist_ok=True)
+        _DIRS_READY.add(directory)
+
+
+def _file_digest(path: Path, salt: bytes = b'') -> str:
+    """计算文件内容（连同salt）的哈希值，用于识别内容相同的输入文件；同一文件未变化时复用上次的结果"""
+    st = os.stat(path)
+    return _cached_file_digest(str(path), st.st_mtime_ns, st.st_size, salt)
+
+
+@lru_cache(maxsize=1024)
+def _cached_file_digest(path: str, mtime_ns: int, size: int, salt: bytes) -> str:
+    """按(路径, 修改时间, 大小, salt)缓存的文件哈希，文件变化后自动失效"""
+    with open(path, 'rb') as f:
+        data = salt + f.read()
+    if xxhash is not None:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+# 同样以ftyp开头的ISO-BMFF图片格式（AVIF/HEIF）的主品牌，不能当作MP4视频
+_IMAGE_FTYP_BRANDS = frozenset({b'avif', b'avis', b'heic', b'heix', b'hevc', b'hevx', b'mif1', b'msf1'})
+
+
+def _sniff_video_container(path: Path) -> Optional[str]:
+    """根据文件头判断是否已经是视频容器，返回'mp4'/'avi'/'mkv'，不是视频时返回None"""
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(12)
+    except OSError:
+        return None
+    if header[4:8] == b'ftyp':
+        return None if header[8:12] in _IMAGE_FTYP_BRANDS else 'mp4'
+    if header[:4] == b'RIFF' and header[8:12] == b'AVI ':
+        return 'avi'
+    if header[:4] == b'\x1a\x45\xdf\xa3':
+        return 'mkv'
+    return None
+
+
+# 后台转换任务完成后结果保留的秒数，期间可重复查询
+_ENCODE_JOB_TTL = 3600
+
+# 后台图片转视频任务在整个进程内共享: job_id -> Future，任何ComfyUIService实例都能按job_id查询结果
+_encode_jobs: Dict[str, Future] = {}
+# 已完成任务的完成时间（按完成先后插入），超过_ENCODE_JOB_TTL秒的任务记录被清除
+_encode_jobs_done_at: Dict[str, float] = {}
+_encode_jobs_lock = threading.Lock()
+_encode_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 4, thread_name_prefix='encode-job')
+
+
+def _mark_encode_job_done(job_id: str):
+    """记录后台任务的完成时间"""
+    with _encode_jobs_lock:
+        _encode_jobs_done_at[job_id] = time.monotonic()
+
+
+def _prune_encode_jobs():
+    """清除完成超过_ENCODE_JOB_TTL秒的任务，从未被查询的任务也会被清除（调用方需持有_encode_jobs_lock）"""
+    deadline = time.monotonic() - _ENCODE_JOB_TTL
+    while _encode_jobs_done_at:
+        job_id, done_at = next(iter(_encode_jobs_done_at.items()))
+        if done_at > deadline:
+            break
+        del _encode_jobs_done_at[job_id]
+        _encode_jobs.pop(job_id, None)
+
+# 临时文件交给后台线程删除，不占用转换调用的返回时间
+_cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='temp-cleanup')
+
+# 限制整个进程内同时运行的FFmpeg转码进程数（TTS等模块每次调用都会新建ComfyUIService实例）
+_ffmpeg_slots = threading.BoundedSemaphore(os.cpu_count() or 4)
+
+
+def _remove_temp_file(path: Path):
+    """删除临时文件（在后台线程中执行），失败只记录警告"""
+    try:
+        path.unlink(missing_ok=True)
+        logger.debug("✅ 清理临时文件: %s", path)
+    except OSError as e:
+        logger.warning("⚠️ 清理临时文件失败: %s", e)
+
+
+def _prune_clip_cache(cache_dir: Path, max_files: int, max_bytes: int):
+    """按最近使用时间从旧到新删除转换缓存，直到文件数和总大小都不超过上限（在后台线程中执行）"""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(entry.stat(), entry.path) for entry in it if entry.name.endswith('.mp4')]
+    except OSError as e:
+        logger.warning("⚠️ 清理转换缓存失败: %s", e)
+        return
+    
+    count = len(entries)
+    total = sum(st.st_size for st, _ in entries)
+    for st, path in sorted(entries, key=lambda item: item[0].st_mtime):
+        if count <= max_files and total <= max_bytes:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        count -= 1
+        total -= st.st_size
+
+
+def _stat_or_none(path) -> Optional[os.stat_result]:
+    """一次os.stat同时判断存在性和获取大小，文件不存在时返回None"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+def _detach_output(path: Path):
+    """写入前删除已有的目标文件：它可能是ComfyUI输出文件的硬链接（见_link_or_copy），原地覆盖写会截断原文件"""
+    Path(path).unlink(missing_ok=True)
+
+
+def _stream_response_to_file(response, save_path: Path):
+    """把stream=True的响应体直接写入文件，内存占用只有一个缓冲块，每块一次write系统调用"""
+    _detach_output(save_path)
+    fd = os.open(save_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        with response:
+            # 由urllib3处理gzip等传输编码
+            response.raw.decode_content = True
+            while True:
+                chunk = response.raw.read(1 << 20)
+                if not chunk:
+                    break
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _scan_files_by_ext(directory: Path, exts) -> List[os.DirEntry]:
+    """用一次os.scandir遍历目录，返回扩展名（小写）在exts中的文件条目"""
+    # DirEntry.stat()复用遍历时取得的信息（Windows上无需额外系统调用）
+    with os.scandir(directory) as it:
+        return [entry for entry in it
+                if os.path.splitext(entry.name)[1].lower() in exts and entry.is_file()]
+
 
 class ComfyUIService:
     def __init__(self):
@@ -28,13 +314,46 @@ class ComfyUIService:
         self.port = Config.COMFYUI_PORT
 
         self.base_url = Config.COMFYUI_URL
+        # 可用的ComfyUI后端列表，第一个为本机服务
+        self.base_urls = [url.strip().rstrip('/') for url in Config.COMFYUI_URLS if url.strip()] or [self.base_url]
         self.client_id = str(uuid.uuid4())
         
+        # 复用同一个HTTP会话，轮询、提交和下载都走keep-alive连接池
+        # 网关类错误自动退避重试；urllib3默认不重试POST，不会重复提交工作流
+        self.session = requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # 本机ComfyUI的output目录
+        self._comfyui_output_dir = Path(Config.COMFYUI_OUTPUT_DIR)
+        
+        # 输出目录在启动时一次性创建，之后各处直接写入
+        for directory in (Config.VIDEO_CLIPS_DIR, Config.AUDIO_DIR, Config.STORYBOARD_DIR,
+                          Config.TEMP_DIR, Config.IMAGE_CLIP_CACHE_DIR):
+            _ensure_dir(directory)
+        
+        # FFmpeg命令模板只构建一次: (输入文件之前的参数, 输入与输出文件之间的参数)
+        self._gif_cmd_template = (
+            (_FFMPEG_BIN, '-y', '-loglevel', 'error', '-nostats', '-i'),  # 覆盖输出、只输出错误信息、不输出进度
+            (*_EVEN_SIZE_FILTER, *_h264_output_args(crf=Config.X264_CRF), '-r', '18')  # 偶数尺寸、H.264编码（优先硬件编码器）、像素格式、质量参数及帧率
+        )
+        # 图片只解码、缩放和转换像素格式一次，再由loop滤镜复制为90帧（5秒×18fps），不再逐帧重复转换
+        image_args = _h264_output_args('stillimage')
+        pix_fmt = image_args[image_args.index('-pix_fmt') + 1]
+        image_filter = f"{_EVEN_SIZE_FILTER[1]},format={pix_fmt},loop=loop=89:size=1:start=0,setpts=N/18/TB"
+        self._image_cmd_template = (
+            (_FFMPEG_BIN, '-y', '-loglevel', 'error', '-nostats', '-i'),  # 覆盖输出、只输出错误信息、不输出进度
+            ('-vf', image_filter, *image_args, '-r', '18', '-t', '5')  # H.264编码（优先硬件编码器）及像素格式，18fps，时长5秒
+        )
+        
     def _check_system_resources(self):
         """检查系统资源使用情况并优化"""
         # 如果psutil不可用，跳过资源检查
         if psutil is None:
-            print("⚠️ 系统资源监控不可用 (缺少psutil模块)")
+            logger.warning("⚠️ 系统资源监控不可用 (缺少psutil模块)")
             return None
             
         try:
@@ -46,35 +365,34 @@ class ComfyUIService:
             # 获取CPU信息
             cpu_percent = psutil.cpu_percent(interval=1)
             
-            print(f"📊 系统资源使用情况:")
-            print(f"  CPU使用率: {cpu_percent:.1f}%")
-            print(f"  内存使用率: {memory_percent:.1f}%")
-            print(f"  可用内存: {available_memory_gb:.2f}GB")
+            logger.info("📊 系统资源使用情况:")
+            logger.info("  CPU使用率: %.1f%%", cpu_percent)
+            logger.info("  内存使用率: %.1f%%", memory_percent)
+            logger.info("  可用内存: %.2fGB", available_memory_gb)
             
             # 如果内存使用率过高，触发垃圾回收
             if memory_percent > 85:  # 降低阈值到85%
-                print("⚠️ 内存使用率较高，触发垃圾回收...")
+                logger.warning("⚠️ 内存使用率较高，触发垃圾回收...")
                 gc.collect()
                 time.sleep(2)  # 等待回收完成
                 
                 # 重新检查内存
                 memory = psutil.virtual_memory()
-                print(f"  回收后内存使用率: {memory.percent:.1f}%")
+                logger.info("  回收后内存使用率: %.1f%%", memory.percent)
                 
             # 如果内存使用率过高，给出警告
             if memory_percent > 90:
-                print("🚨 内存使用率过高，建议重启ComfyUI服务!")
+                logger.warning("🚨 内存使用率过高，建议重启ComfyUI服务!")
                 
                 # 尝试优化：强制释放更多资源
                 if memory_percent > 95:
-                    print("⚠️ 内存使用率极高，执行紧急优化措施...")
+                    logger.warning("⚠️ 内存使用率极高，执行紧急优化措施...")
                     # 清理Python垃圾
                     gc.collect()
                     gc.collect()  # 双重垃圾回收
                     
                     # 清理系统缓存（如果可能）
                     try:
-                        import os
                         if hasattr(os, 'system') and os.name == 'nt':  # Windows
                             # Windows清理内存命令
                             os.system('echo 1 > nul')  # 空操作，但可能触发一些清理
@@ -86,7 +404,7 @@ class ComfyUIService:
                         from .resource_optimizer import resource_optimizer
                         resource_optimizer.force_cleanup()
                     except ImportError:
-                        print("⚠️ 资源优化器不可用")
+                        logger.warning("⚠️ 资源优化器不可用")
                 
             return {
                 'cpu_percent': cpu_percent,
@@ -94,13 +412,14 @@ class ComfyUIService:
                 'available_memory_gb': available_memory_gb
             }
         except Exception as e:
-            print(f"⚠️ 无法获取系统资源信息: {e}")
+            logger.warning("⚠️ 无法获取系统资源信息: %s", e)
             return None
     
-    def check_connection(self) -> bool:
+    def check_connection(self, base_url: Optional[str] = None) -> bool:
         """检查ComfyUI服务连接"""
+        base_url = base_url or self.base_url
         try:
-            response = requests.get(f"{self.base_url}/system_stats", timeout=5)
+            response = self.session.get(f"{base_url}/system_stats", timeout=5)
             if response.status_code == 200:
                 # 尝试获取ComfyUI的系统信息
                 try:
@@ -111,7 +430,7 @@ class ComfyUIService:
                 
                 # 尝试获取ComfyUI的输入目录信息
                 try:
-                    info_response = requests.get(f"{self.base_url}/object_info", timeout=5)
+                    info_response = self.session.get(f"{base_url}/object_info", timeout=5)
                     if info_response.status_code == 200:
                         object_info = info_response.json()
                         # 查找LoadImage节点的信息
@@ -245,9 +564,12 @@ class ComfyUIService:
     
     def _create_placeholder_image(self, image_path: Path, text: str):
         """创建占位符图片"""
+        if Image is None:
+            print(f"⚠️ PIL库未安装，使用简单占位符")
+            self._create_simple_placeholder(image_path, text)
+            return
+        
         try:
-            from PIL import Image, ImageDraw, ImageFont
-            
             # 创建一个简单的占位符图片
             width, height = 512, 512
             image = Image.new('RGB', (width, height), color='lightgray')
@@ -277,9 +599,6 @@ class ComfyUIService:
             image.save(image_path, 'JPEG')
             print(f"✅ 创建占位符图片: {image_path}")
             
-        except ImportError:
-            print(f"⚠️ PIL库未安装，使用简单占位符")
-            self._create_simple_placeholder(image_path, text)
         except Exception as e:
             print(f"⚠️ 创建占位符图片失败: {str(e)}")
             self._create_simple_placeholder(image_path, text)
@@ -306,7 +625,6 @@ class ComfyUIService:
     def generate_single_image(self, prompt: str, filename: str = None, max_retries: int = 3) -> Optional[str]:
         """生成单张图片 - 带重试机制，专用于编辑提示词重新生成"""
         if not filename:
-            import time
             timestamp = int(time.time() * 1000)
             filename = f"single_{timestamp:03d}"
         
@@ -322,7 +640,6 @@ class ComfyUIService:
             try:
                 if retry > 0:
                     print(f"🔄 第{retry}次重试 (共{max_retries}次)...")
-                    import time
                     time.sleep(2 * retry)  # 逐渐增加等待时间
                 
                 # 检查ComfyUI连接状态
@@ -341,9 +658,10 @@ class ComfyUIService:
                 print(f"⚙️ 执行工作流...")
                 image_path = self._execute_workflow(workflow, filename)
                 
-                if image_path and Path(image_path).exists():
+                st = _stat_or_none(image_path) if image_path else None
+                if st:
                     # 验证生成的图片
-                    file_size = Path(image_path).stat().st_size
+                    file_size = st.st_size
                     if file_size > 1024:  # 大于1KB
                         print(f"✅ 单张图片生成成功: {Path(image_path).name}")
                         print(f"📊 文件大小: {file_size/1024:.1f}KB")
@@ -410,7 +728,6 @@ class ComfyUIService:
                 try:
                     if retry > 0:
                         print(f"🔄 第{retry}次重试 (共{max_retries}次)...")
-                        import time
                         time.sleep(2 * retry)  # 逐渐增加等待时间
                     
                     # 检查ComfyUI连接状态
@@ -429,9 +746,10 @@ class ComfyUIService:
                     print(f"⚙️ 执行工作流...")
                     image_path = self._execute_workflow(workflow, f"storyboard_{i+1:03d}")
                     
-                    if image_path and Path(image_path).exists():
+                    st = _stat_or_none(image_path) if image_path else None
+                    if st:
                         # 验证生成的图片
-                        file_size = Path(image_path).stat().st_size
+                        file_size = st.st_size
                         if file_size > 1024:  # 大于1KB
                             image_paths.append(image_path)
                             print(f"✅ 第{i+1}张分镜图生成成功: {Path(image_path).name}")
@@ -550,65 +868,6 @@ class ComfyUIService:
         
         print("⏱️ 等待2秒后重试...")
     
-    def _queue_prompt(self, workflow: Dict) -> Optional[str]:
-        """提交工作流到队列"""
-        try:
-            prompt_data = {
-                "prompt": workflow,
-                "client_id": self.client_id
-            }
-            
-            print(f"\n=== 提交工作流到ComfyUI ===")
-            print(f"Client ID: {self.client_id}")
-            print(f"URL: {self.base_url}/prompt")
-            print(f"工作流节点数量: {len(workflow)}")
-            
-            # 显示工作流的前几个节点信息
-            for i, (node_id, node_data) in enumerate(list(workflow.items())[:3]):
-                print(f"Node {node_id}: {node_data.get('class_type', 'Unknown')}")
-                if 'inputs' in node_data:
-                    for key, value in list(node_data['inputs'].items())[:3]:
-                        if isinstance(value, str) and len(value) > 50:
-                            print(f"  {key}: {value[:50]}...")
-                        else:
-                            print(f"  {key}: {value}")
-            
-            response = requests.post(
-                f"{self.base_url}/prompt",
-                json=prompt_data,
-                timeout=30
-            )
-            
-            print(f"响应状态码: {response.status_code}")
-            
-            if response.status_code == 200:
-                result = response.json()
-                prompt_id = result.get("prompt_id")
-                print(f"Prompt ID: {prompt_id}")
-                print(f"=========================\n")
-                return prompt_id
-            else:
-                print(f"错误响应: {response.text}")
-                
-                # 尝试解析错误信息
-                try:
-                    error_data = response.json()
-                    print(f"错误详情: {json.dumps(error_data, indent=2, ensure_ascii=False)}")
-                except:
-                    print(f"无法解析错误响应")
-                
-                print(f"=========================\n")
-                return None
-                
-        except Exception as e:
-            print(f"提交工作流异常: {str(e)}")
-            # 检查是否是连接错误，如果是则尝试重启服务
-            if "WinError 10061" in str(e) or "Failed to establish a new connection" in str(e):
-                print("🚨 ComfyUI服务连接失败，尝试检查服务状态...")
-                self._attempt_service_recovery()
-            print(f"=========================\n")
-            return None
-    
     def _attempt_service_recovery(self):
         """尝试恢复ComfyUI服务"""
         try:
@@ -616,7 +875,6 @@ class ComfyUIService:
             
             # 1. 等待一段时间让服务可能自行恢复
             print("⏳ 等待服务可能的自动恢复...")
-            import time
             time.sleep(10)
             
             # 2. 检查服务是否恢复
@@ -646,318 +904,239 @@ class ComfyUIService:
             print(f"服务恢复尝试失败: {str(e)}")
             return False
     
-    def _wait_for_completion(self, prompt_id: str, timeout: int = 900) -> Optional[Dict]:
-        """等待工作流完成 - 增加超时时间到15分钟"""
-        start_time = time.time()
-        
-        # 增加初始等待时间，让ComfyUI有时间开始处理
-        time.sleep(2)
-        
-        while time.time() - start_time < timeout:
-            try:
-                # 检查队列状态
-                response = requests.get(f"{self.base_url}/history/{prompt_id}", timeout=30)
-                
-                if response.status_code == 200:
-                    history = response.json()
-                    
-                    if prompt_id in history:
-                        # 任务完成
-                        outputs = history[prompt_id].get("outputs", {})
-                        return outputs
-                else:
-                    print(f"错误响应: {response.text}")
-                    return None
-                
-            except Exception as e:
-                print(f"检查队列状态异常: {str(e)}")
-                return None
-    
-    def _save_output(self, output_images: Dict, filename: str) -> Optional[str]:
-        """保存输出文件"""
+    def _execute_workflow_simple(self, workflow: Dict, video_filename: str, timestamp: int, base_url: Optional[str] = None) -> Optional[str]:
+        """简化的工作流执行，按文件名+时间戳查找视频"""
+        base_url = base_url or self.base_url
         try:
-            import base64
-            
-            print(f"\n=== 保存输出文件 ===")
-            print(f"文件名: {filename}")
-            print(f"输出图片数量: {len(output_images)}")
-            
-            if len(output_images) == 0:
-                print(f"✗ 未找到任何输出图片")
-                return None
-            
-            # 选择第一个输出图片
-            output_image = output_images[0]
-            image_data = output_image[0]
-            image_format = output_image[1]
-            image_name = output_image[2]
-            
-            print(f"选择图片: {image_name}")
-            print(f"图片格式: {image_format}")
-            
-            # 生成目标路径
-            dest_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            print(f"目标路径: {dest_path}")
-            
-            # 确保目录存在
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # 解码base64数据并保存文件
-            with open(dest_path, "wb") as output_file:
-                output_file.write(base64.b64decode(image_data))
-            
-            # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功保存视频: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                return str(dest_path)
-            else:
-                print(f"✗ 文件保存失败或文件为空")
+            # 队列提示
+            prompt_id = self._queue_prompt(workflow, base_url=base_url)
+            if not prompt_id:
                 return None
-                
-        except Exception as e:
-            print(f"保存输出文件异常: {str(e)}")
-            return None
-    
-    def _get_comfyui_output_files(self) -> Dict[str, float]:
-        """获取ComfyUI output目录中的所有文件及其修改时间"""
-        try:
-            comfyui_output_dir = Path("F:/ComfyUI_windows_portable/ComfyUI/output")
-            if not comfyui_output_dir.exists():
-                return {}
-            
-            files_info = {}
-            # 获取所有视频文件
-            for ext in ['*.mp4', '*.avi', '*.mov', '*.mkv']:
-                for file_path in comfyui_output_dir.glob(ext):
-                    files_info[str(file_path)] = file_path.stat().st_mtime
             
-            return files_info
         except Exception as e:
-            print(f"获取文件列表失败: {str(e)}")
-            return {}
+            logger.error("执行工作流异常: %s", e)
+            if base_url != self.base_url:
+                return None
+            # 如果有异常，也尝试按时间戳查找
+            return self._find_video_by_timestamp(video_filename, timestamp)
+        
+        return self._collect_video_output(prompt_id, video_filename, timestamp, base_url=base_url)
     
-    def _execute_workflow_with_file_tracking(self, workflow: Dict, filename: str, files_before: Dict[str, float]) -> Optional[str]:
-        """执行ComfyUI工作流并跟踪新生成的文件"""
+    def _collect_video_output(self, prompt_id: str, video_filename: str, timestamp: int,
+                              base_url: Optional[str] = None) -> Optional[str]:
+        """等待已入队的视频任务完成并保存输出，API失败时按时间戳查找"""
+        base_url = base_url or self.base_url
         try:
-            # 队列提示
-            prompt_id = self._queue_prompt(workflow)
-            if not prompt_id:
-                return None
-            
             # 等待完成
-            output_images = self._wait_for_completion(prompt_id)
+            output_images = self._wait_for_completion(prompt_id, base_url=base_url)
             
             if output_images:
                 # 首先尝试通过API保存
-                api_result = self._save_output(output_images, filename)
+                api_result = self._save_output(output_images, video_filename, base_url=base_url)
                 if api_result:
                     return api_result
             
-            # API失败，使用文件跟踪方式
-            print(f"⚠️ API保存失败，使用文件跟踪方式...")
-            return self._find_new_video_file(files_before, filename)
+            # 远程后端的输出不在本机output目录，无法按时间戳查找
+            if base_url != self.base_url:
+                return None
+            
+            # API失败，按时间戳查找最新文件
+            logger.warning("⚠️ API保存失败，按时间戳查找最新视频文件...")
+            return self._find_video_by_timestamp(video_filename, timestamp)
             
         except Exception as e:
-            print(f"执行工作流异常: {str(e)}")
-            # 如果有异常，也尝试文件跟踪
-            return self._find_new_video_file(files_before, filename)
+            logger.error("执行工作流异常: %s", e)
+            if base_url != self.base_url:
+                return None
+            # 如果有异常，也尝试按时间戳查找
+            return self._find_video_by_timestamp(video_filename, timestamp)
     
-    def _find_new_video_file(self, files_before: Dict[str, float], filename: str) -> Optional[str]:
-        """查找新生成的视频文件"""
+    def _find_video_by_timestamp(self, video_filename: str, timestamp: int) -> Optional[str]:
+        """按时间戳查找最新生成的视频文件，确保每次都生成唯一的新文件"""
         try:
-            import time
-            # 等待一下让ComfyUI完成文件写入
-            time.sleep(2)
+            # 等待ComfyUI完成文件写入：目录1秒内无写入即认为写完，最多等5秒
+            logger.info("⏳ 等待ComfyUI完成文件写入...")
+            get_output_watcher(self._comfyui_output_dir).wait_quiet(quiet=1.0, timeout=5)
             
-            files_after = self._get_comfyui_output_files()
+            comfyui_output_dir = self._comfyui_output_dir
+            if not comfyui_output_dir.exists():
+                logger.warning("✗ ComfyUI output目录不存在: %s", comfyui_output_dir)
+                return None
             
-            # 找出新增的文件
-            new_files = []
-            for file_path, mtime in files_after.items():
-                if file_path not in files_before:
-                    # 全新文件
-                    new_files.append((file_path, mtime, 'new'))
-                elif mtime > files_before[file_path]:
-                    # 修改过的文件
-                    new_files.append((file_path, mtime, 'modified'))
+            logger.info("\n=== 查找视频文件 (时间戳: %s) ===", timestamp)
+            logger.info("搜索目录: %s", comfyui_output_dir)
+            logger.info("视频文件名: %s", video_filename)
             
-            if not new_files:
-                print(f"✗ 未找到新生成的视频文件")
+            # 清理项目目录中的历史文件，防止混淆
+            self._clean_old_video_files(video_filename)
+            
+            # 查找所有视频文件，一次目录扫描同时取得修改时间和大小: [(路径, 修改时间, 大小)]
+            video_files = []
+            for entry in _scan_files_by_ext(comfyui_output_dir, _VIDEO_EXTS):
+                try:
+                    file_stat = entry.stat()
+                except OSError as e:
+                    logger.info("检查文件 %s 时出错: %s", entry.name, e)
+                    continue
+                video_files.append((Path(entry.path), file_stat.st_mtime, file_stat.st_size))
+            
+            if not video_files:
+                logger.warning("✗ 未找到任何视频文件")
+                # 显示目录中的文件以便调试
+                all_files = list(comfyui_output_dir.glob('*.*'))
+                logger.info("目录中的所有文件: %s", [f.name for f in all_files[:10]])
                 return None
             
-            print(f"找到 {len(new_files)} 个新/修改的文件:")
-            for file_path, mtime, status in new_files:
-                file_obj = Path(file_path)
-                size = file_obj.stat().st_size / 1024 / 1024
-                print(f"  {file_obj.name} ({size:.2f}MB, {status})")
-            
-            # 选择最新的文件（按修改时间）
-            latest_file = max(new_files, key=lambda x: x[1])
-            latest_path = Path(latest_file[0])
-            
-            # 检查文件大小
-            file_size = latest_path.stat().st_size
-            if file_size < 100 * 1024:  # 小于100KB
-                print(f"⚠️ 最新文件太小 ({file_size/1024:.1f}KB)，可能生成失败")
-                # 尝试找更大的文件
-                valid_files = [(f, m, s) for f, m, s in new_files if Path(f).stat().st_size > 100 * 1024]
-                if valid_files:
-                    # 选择最新的有效文件
-                    latest_file = max(valid_files, key=lambda x: x[1])
-                    latest_path = Path(latest_file[0])
-                    print(f"使用最新的有效文件: {latest_path.name}")
-            
-            print(f"选择文件: {latest_path}")
+            logger.info("总共找到 %s 个视频文件", len(video_files))
             
-            # 复制到项目目录
-            return self._copy_video_file(latest_path, filename)
+            # 查找在时间戳之后生成的文件（转换为秒）
+            timestamp_seconds = timestamp / 1000.0
             
-        except Exception as e:
-            print(f"查找新文件异常: {str(e)}")
-            return None
-    
-    def _copy_video_file(self, source_path: Path, filename: str) -> Optional[str]:
-        """复制视频文件到项目目录"""
-        try:
-            import shutil
+            # 添加更严格的时间范围筛选，避免选择历史文件
+            # 扩大时间窗口以适应可能的系统时间差异
+            min_timestamp = timestamp_seconds - 30  # 允许最多30秒的时间偏差
+            max_timestamp = timestamp_seconds + 300  # 允许最多5分钟的时间偏差
             
-            # 目标路径
-            dest_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
+            recent_files = []
             
-            # 确保目录存在
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
+            for video_file, file_mtime, file_size in video_files:
+                try:
+                    file_time_readable = time.ctime(file_mtime)
+                    
+                    logger.debug("检查文件: %s (%.2fMB, %s)", video_file.name, file_size * _MB, file_time_readable)
+                    
+                    # 严格的时间范围筛选：必须在合理的时间窗口内生成
+                    if (file_mtime >= min_timestamp and 
+                        file_mtime <= max_timestamp and 
+                        file_size > 100 * 1024):
+                        recent_files.append((video_file, file_mtime, file_size))
+                        logger.info("✅ 符合条件的候选文件: %s (%.2fMB)", video_file.name, file_size * _MB)
+                    elif file_mtime < min_timestamp:
+                        logger.debug("文件太旧，忽略: %s", video_file.name)
+                    elif file_mtime > max_timestamp:
+                        logger.debug("文件太新，忽略: %s", video_file.name)
+                    elif file_size <= 100 * 1024:
+                        logger.debug("文件太小，忽略: %s", video_file.name)
+                except Exception as e:
+                    logger.info("检查文件 %s 时出错: %s", video_file.name, e)
+                    continue
             
-            # 复制文件
-            shutil.copy2(source_path, dest_path)
+            if not recent_files:
+                logger.warning("⚠️ 无法找到在时间窗口内生成的有效视频文件")
+                try:
+                    logger.info("时间戳范围: %s ~ %s", time.ctime(min_timestamp), time.ctime(max_timestamp))
+                except Exception as e:
+                    logger.info("时间戳格式化错误: %s", e)
+                
+                # 最后的备用方案：选择最新的大文件（但要确保不是太旧的）
+                current_time = time.time()
+                recent_enough_files = [
+                    (f, file_mtime, file_size) for f, file_mtime, file_size in video_files
+                    if file_size > 100 * 1024 and file_mtime > current_time - 600  # 10分钟内
+                ]
+                
+                if recent_enough_files:
+                    recent_files = [max(recent_enough_files, key=lambda x: x[1])]
+                    logger.info("备用方案：使用10分钟内最新的文件: %s", recent_files[0][0].name)
+                else:
+                    logger.warning("✗ 没有找到任何近期的有效视频文件")
+                    return None
             
-            # 等待一下确保复制完成
-            import time
-            time.sleep(0.5)
+            # 选择最新的文件
+            latest_file, _, latest_size = max(recent_files, key=lambda x: x[1])
+            logger.info("最终选择文件: %s", latest_file)
+            logger.info("文件大小: %.2fMB", latest_size * _MB)
+            logger.info("文件扩展名: %s", latest_file.suffix)
             
-            # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功复制视频: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                return str(dest_path)
+            # 确保选择的是视频文件
+            if latest_file.suffix.lower() not in _VIDEO_EXTS:
+                logger.warning("⚠️ 警告：选择的文件不是标准视频格式: %s", latest_file.suffix)
+                logger.info("但继续处理，可能是ComfyUI的特殊格式")
+            
+            # 复制到项目目录并验证
+            result = self._copy_video_file_simple(latest_file, video_filename)
+            
+            if result:
+                logger.info("✅ 视频文件成功生成: %s", result)
             else:
-                print(f"✗ 文件复制失败或文件为空")
-                return None
-                
+                logger.error("❌ 视频文件复制失败")
+            
+            return result
+            
         except Exception as e:
-            print(f"复制视频文件异常: {str(e)}")
+            logger.error("按时间戳查找文件异常: %s", e)
+            traceback.print_exc()
             return None
     
-    def _encode_image_to_base64(self, image_path: str) -> str:
-        """将图片编码为base64"""
-        try:
-            with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return encoded_string
-        except Exception as e:
-            print(f"图片编码失败: {str(e)}")
-            return ""
-        """将图片编码为base64"""
+    def _clean_old_video_files(self, video_filename: str):
+        """清理项目目录中可能存在的旧视频文件，防止缓存混淆"""
         try:
-            with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return encoded_string
+            # 清理可能存在的同名文件
+            old_file = Config.VIDEO_CLIPS_DIR / f"{video_filename}.mp4"
+            if old_file.exists():
+                old_file.unlink()
+                logger.info("🗑️ 清理旧文件: %s", old_file)
+            
+            # 清理带有相似名称的文件（防止时间戳重复）
+            base_name = video_filename.partition('_')[0]
+            for old_file in Config.VIDEO_CLIPS_DIR.glob(f"{base_name}_*.mp4"):
+                if old_file.name != f"{video_filename}.mp4":
+                    try:
+                        # 检查文件是否太新（5分钟内），如果是则不删除
+                        if time.time() - old_file.stat().st_mtime > 300:  # 5分钟
+                            old_file.unlink()
+                            logger.info("🗑️ 清理历史文件: %s", old_file)
+                        else:
+                            logger.info("⏳ 保留最近文件: %s", old_file)
+                    except Exception as e:
+                        logger.warning("⚠️ 清理文件失败: %s - %s", old_file, e)
+                        
         except Exception as e:
-            print(f"图片编码失败: {str(e)}")
-            return ""
+            logger.error("⚠️ 清理旧文件异常: %s", e)
     
-    def _find_latest_generated_image(self, filename: str) -> Optional[str]:
-        """从 ComfyUI 输出目录查找最新生成的图片"""
+    def _copy_video_file_simple(self, source_path: Path, video_filename: str) -> Optional[str]:
+        """简化的视频文件复制"""
         try:
-            import time
-            # 等待一下让ComfyUI完成文件写入
-            time.sleep(2)
+            logger.info("\n=== 复制视频文件 ===")
+            logger.info("源文件: %s", source_path)
+            logger.info("源文件扩展名: %s", source_path.suffix)
+            # 文件大小只用于调试日志，未开启DEBUG时不做stat
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("源文件大小: %.2fMB", source_path.stat().st_size * _MB)
+            logger.info("目标文件名: %s", video_filename)
             
-            comfyui_output_dir = Path("F:/ComfyUI_windows_portable/ComfyUI/output")
-            if not comfyui_output_dir.exists():
-                print(f"✗ ComfyUI output目录不存在: {comfyui_output_dir}")
-                return None
+            # 验证源文件是视频文件
+            if source_path.suffix.lower() not in _VIDEO_EXTS:
+                logger.warning("⚠️ 警告：源文件不是视频格式: %s", source_path.suffix)
+                logger.info("但继续复制，可能是ComfyUI的输出文件命名问题")
             
-            print(f"\n=== 查找最新生成的图片 ===")
-            print(f"搜索目录: {comfyui_output_dir}")
+            # 目标路径 - 确保使用.mp4扩展名
+            dest_path = Config.VIDEO_CLIPS_DIR / f"{video_filename}.mp4"
+            logger.info("目标路径: %s", dest_path)
             
-            # 查找所有图片文件
-            image_files = []
-            for ext in ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.webp']:
-                found_files = list(comfyui_output_dir.glob(ext))
-                image_files.extend(found_files)
-                if found_files:
-                    print(f"找到 {len(found_files)} 个 {ext} 文件")
+            # 同一分区时硬链接，否则复制文件
+            logger.info("开始复制文件...")
+            self._link_or_copy(source_path, dest_path)
             
-            if not image_files:
-                print(f"✗ 未找到任何图片文件")
+            # 验证文件
+            st = _stat_or_none(dest_path)
+            if st and st.st_size > 0:
+                file_size = st.st_size
+                logger.info("✅ 成功复制视频: %s", dest_path)
+                logger.info("文件大小: %.2fMB", file_size * _MB)
+                logger.info("文件扩展名: %s", dest_path.suffix)
+                logger.info("=========================\n")
+                return str(dest_path)
+            else:
+                logger.warning("✗ 文件复制失败或文件为空")
+                logger.info("=========================\n")
                 return None
-            
-            print(f"总共找到 {len(image_files)} 个图片文件")
-            
-            # 按修改时间排序，选择最新的
-            image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-            
-            # 选择最新的有效图片（大于50KB）
-            for image_file in image_files[:5]:  # 只检查最新的5个文件
-                file_size = image_file.stat().st_size
-                file_time = time.ctime(image_file.stat().st_mtime)
-                print(f"检查文件: {image_file.name} ({file_size/1024:.1f}KB, {file_time})")
                 
-                if file_size > 50 * 1024:  # 大于50KB
-                    print(f"✅ 选择最新的有效图片: {image_file.name}")
-                    
-                    # 复制到项目目录
-                    return self._copy_image_file(image_file, filename)
-            
-            print(f"✗ 未找到有效的图片文件（大于50KB）")
-            return None
-            
         except Exception as e:
-            print(f"查找最新图片异常: {str(e)}")
+            logger.error("复制视频文件异常: %s", e)
+            logger.info("=========================\n")
             return None
     
-    def _copy_image_file(self, source_path: Path, filename: str) -> Optional[str]:
-        """复制图片文件到项目目录"""
-        try:
-            import shutil
-            
-            print(f"\n=== 复制图片文件 ===")
-            print(f"源文件: {source_path}")
-            print(f"源文件大小: {source_path.stat().st_size/1024/1024:.2f}MB")
-            
-            # 目标路径 - 使用原始扩展名
-            dest_path = Config.STORYBOARD_DIR / f"{filename}{source_path.suffix}"
-            print(f"目标路径: {dest_path}")
-            
-            # 确保目录存在
-            Config.STORYBOARD_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # 复制文件
-            print(f"开始复制文件...")
-            shutil.copy2(source_path, dest_path)
-            
-            # 等待一下确保复制完成
-            import time
-            time.sleep(0.5)
-            
-            # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功复制图片: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                print(f"=========================\n")
-                return str(dest_path)
-            else:
-                print(f"✗ 文件复制失败或文件为空")
-                return None
-                
-        except Exception as e:
-            print(f"复制图片文件异常: {str(e)}")
-            return None
-
     def _execute_workflow(self, workflow: Dict, filename: str) -> Optional[str]:
         """执行ComfyUI工作流"""
         try:
@@ -990,333 +1169,84 @@ class ComfyUIService:
             print(f"执行工作流失败: {str(e)}")
             return None
     
-    def _queue_prompt(self, workflow: Dict) -> Optional[str]:
+    def _queue_prompt(self, workflow: Dict, base_url: Optional[str] = None) -> Optional[str]:
         """提交工作流到队列"""
+        base_url = base_url or self.base_url
         try:
             prompt_data = {
                 "prompt": workflow,
                 "client_id": self.client_id
             }
             
-            print(f"\n=== 提交工作流到ComfyUI ===")
-            print(f"Client ID: {self.client_id}")
-            print(f"URL: {self.base_url}/prompt")
-            print(f"工作流节点数量: {len(workflow)}")
+            logger.info("\n=== 提交工作流到ComfyUI ===")
+            logger.info("Client ID: %s", self.client_id)
+            logger.info("URL: %s/prompt", base_url)
+            logger.info("工作流节点数量: %s", len(workflow))
             
             # 显示工作流的前几个节点信息
             for i, (node_id, node_data) in enumerate(list(workflow.items())[:3]):
-                print(f"Node {node_id}: {node_data.get('class_type', 'Unknown')}")
+                logger.info("Node %s: %s", node_id, node_data.get('class_type', 'Unknown'))
                 if 'inputs' in node_data:
                     for key, value in list(node_data['inputs'].items())[:3]:
                         if isinstance(value, str) and len(value) > 50:
-                            print(f"  {key}: {value[:50]}...")
+                            logger.info("  %s: %s...", key, value[:50])
                         else:
-                            print(f"  {key}: {value}")
+                            logger.info("  %s: %s", key, value)
             
-            response = requests.post(
-                f"{self.base_url}/prompt",
-                json=prompt_data,
+            response = self.session.post(
+                f"{base_url}/prompt",
+                data=_json_dumps(prompt_data),
+                headers={'Content-Type': 'application/json'},
                 timeout=30
             )
             
-            print(f"响应状态码: {response.status_code}")
+            logger.info("响应状态码: %s", response.status_code)
             
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 prompt_id = result.get("prompt_id")
-                print(f"Prompt ID: {prompt_id}")
-                print(f"=========================\n")
+                logger.info("Prompt ID: %s", prompt_id)
+                logger.info("=========================\n")
                 return prompt_id
             else:
-                print(f"错误响应: {response.text}")
+                logger.info("错误响应: %s", response.text)
                 
                 # 尝试解析错误信息
                 try:
-                    error_data = response.json()
-                    print(f"错误详情: {json.dumps(error_data, indent=2, ensure_ascii=False)}")
+                    error_data = _json_loads(response.content)
+                    logger.info("错误详情: %s", _json_dumps(error_data, pretty=True).decode('utf-8'))
                 except:
-                    print(f"无法解析错误响应")
-                
-                print(f"=========================\n")
-                return None
-                
-        except Exception as e:
-            print(f"提交工作流异常: {str(e)}")
-            print(f"=========================\n")
-            return None
-    
-    def _wait_for_completion(self, prompt_id: str, timeout: int = 900) -> Optional[Dict]:
-        """等待工作流完成 - 增加超时时间到15分钟"""
-        start_time = time.time()
-        
-        # 增加初始等待时间，让ComfyUI有时间开始处理
-        time.sleep(2)
-        
-        while time.time() - start_time < timeout:
-            try:
-                # 检查队列状态
-                response = requests.get(f"{self.base_url}/history/{prompt_id}", timeout=30)
-                
-                if response.status_code == 200:
-                    history = response.json()
-                    
-                    if prompt_id in history:
-                        # 任务完成
-                        outputs = history[prompt_id].get("outputs", {})
-                        return outputs
-                else:
-                    print(f"错误响应: {response.text}")
-                    return None
+                    logger.info("无法解析错误响应")
                 
-            except Exception as e:
-                print(f"检查队列状态异常: {str(e)}")
-                return None
-    
-    def _execute_workflow_simple(self, workflow: Dict, video_filename: str, timestamp: int) -> Optional[str]:
-        """简化的工作流执行，按文件名+时间戳查找视频"""
-        try:
-            # 队列提示
-            prompt_id = self._queue_prompt(workflow)
-            if not prompt_id:
-                return None
-            
-            # 等待完成
-            output_images = self._wait_for_completion(prompt_id)
-            
-            if output_images:
-                # 首先尝试通过API保存
-                api_result = self._save_output(output_images, video_filename)
-                if api_result:
-                    return api_result
-            
-            # API失败，按时间戳查找最新文件
-            print(f"⚠️ API保存失败，按时间戳查找最新视频文件...")
-            return self._find_video_by_timestamp(video_filename, timestamp)
-            
-        except Exception as e:
-            print(f"执行工作流异常: {str(e)}")
-            # 如果有异常，也尝试按时间戳查找
-            return self._find_video_by_timestamp(video_filename, timestamp)
-    
-    def _find_video_by_timestamp(self, video_filename: str, timestamp: int) -> Optional[str]:
-        """按时间戳查找最新生成的视频文件，确保每次都生成唯一的新文件"""
-        try:
-            import time
-            # 等待ComfyUI完成文件写入 - 增加等待时间
-            print("⏳ 等待ComfyUI完成文件写入...")
-            time.sleep(5)  # 增加等待时间确保文件完全写入
-            
-            comfyui_output_dir = Path("F:/ComfyUI_windows_portable/ComfyUI/output")
-            if not comfyui_output_dir.exists():
-                print(f"✗ ComfyUI output目录不存在: {comfyui_output_dir}")
-                return None
-            
-            print(f"\n=== 查找视频文件 (时间戳: {timestamp}) ===")
-            print(f"搜索目录: {comfyui_output_dir}")
-            print(f"视频文件名: {video_filename}")
-            
-            # 清理项目目录中的历史文件，防止混淆
-            self._clean_old_video_files(video_filename)
-            
-            # 查找所有视频文件
-            video_files = []
-            for ext in ['*.mp4', '*.avi', '*.mov', '*.mkv']:
-                found_files = list(comfyui_output_dir.glob(ext))
-                video_files.extend(found_files)
-                if found_files:
-                    print(f"找到 {len(found_files)} 个 {ext} 文件")
-            
-            if not video_files:
-                print(f"✗ 未找到任何视频文件")
-                # 显示目录中的文件以便调试
-                all_files = list(comfyui_output_dir.glob('*.*'))
-                print(f"目录中的所有文件: {[f.name for f in all_files[:10]]}")
+                logger.info("=========================\n")
                 return None
-            
-            print(f"总共找到 {len(video_files)} 个视频文件")
-            
-            # 查找在时间戳之后生成的文件（转换为秒）
-            timestamp_seconds = timestamp / 1000.0
-            
-            # 添加更严格的时间范围筛选，避免选择历史文件
-            # 扩大时间窗口以适应可能的系统时间差异
-            min_timestamp = timestamp_seconds - 30  # 允许最多30秒的时间偏差
-            max_timestamp = timestamp_seconds + 300  # 允许最多5分钟的时间偏差
-            
-            recent_files = []
-            
-            for video_file in video_files:
-                try:
-                    file_mtime = video_file.stat().st_mtime
-                    file_size = video_file.stat().st_size
-                    file_time_readable = time.ctime(file_mtime)
-                    
-                    print(f"检查文件: {video_file.name} ({file_size/1024/1024:.2f}MB, {file_time_readable})")
-                    
-                    # 严格的时间范围筛选：必须在合理的时间窗口内生成
-                    if (file_mtime >= min_timestamp and 
-                        file_mtime <= max_timestamp and 
-                        file_size > 100 * 1024):
-                        recent_files.append((video_file, file_mtime, file_size))
-                        print(f"✅ 符合条件的候选文件: {video_file.name} ({file_size/1024/1024:.2f}MB)")
-                    elif file_mtime < min_timestamp:
-                        print(f"❌ 文件太旧，忽略: {video_file.name}")
-                    elif file_mtime > max_timestamp:
-                        print(f"❌ 文件太新，忽略: {video_file.name}")
-                    elif file_size <= 100 * 1024:
-                        print(f"❌ 文件太小，忽略: {video_file.name}")
-                except Exception as e:
-                    print(f"检查文件 {video_file.name} 时出错: {e}")
-                    continue
-            
-            if not recent_files:
-                print(f"⚠️ 无法找到在时间窗口内生成的有效视频文件")
-                try:
-                    print(f"时间戳范围: {time.ctime(min_timestamp)} ~ {time.ctime(max_timestamp)}")
-                except Exception as e:
-                    print(f"时间戳格式化错误: {e}")
                 
-                # 最后的备用方案：选择最新的大文件（但要确保不是太旧的）
-                current_time = time.time()
-                recent_enough_files = []
-                for f in video_files:
-                    try:
-                        file_stat = f.stat()
-                        if (file_stat.st_size > 100 * 1024 and 
-                            file_stat.st_mtime > current_time - 600):  # 10分钟内
-                            recent_enough_files.append((f, file_stat.st_mtime, file_stat.st_size))
-                    except Exception as e:
-                        print(f"检查文件 {f.name} 时出错: {e}")
-                        continue
-                
-                if recent_enough_files:
-                    recent_files = [max(recent_enough_files, key=lambda x: x[1])]
-                    print(f"备用方案：使用10分钟内最新的文件: {recent_files[0][0].name}")
-                else:
-                    print(f"✗ 没有找到任何近期的有效视频文件")
-                    return None
-            
-            # 选择最新的文件
-            latest_file = max(recent_files, key=lambda x: x[1])[0]
-            print(f"最终选择文件: {latest_file}")
-            print(f"文件大小: {latest_file.stat().st_size/1024/1024:.2f}MB")
-            print(f"文件扩展名: {latest_file.suffix}")
-            
-            # 确保选择的是视频文件
-            if latest_file.suffix.lower() not in ['.mp4', '.avi', '.mov', '.mkv']:
-                print(f"⚠️ 警告：选择的文件不是标准视频格式: {latest_file.suffix}")
-                print(f"但继续处理，可能是ComfyUI的特殊格式")
-            
-            # 复制到项目目录并验证
-            result = self._copy_video_file_simple(latest_file, video_filename)
-            
-            if result:
-                print(f"✅ 视频文件成功生成: {result}")
-            else:
-                print(f"❌ 视频文件复制失败")
-            
-            return result
-            
         except Exception as e:
-            print(f"按时间戳查找文件异常: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.error("提交工作流异常: %s", e)
+            logger.info("=========================\n")
             return None
     
-    def _clean_old_video_files(self, video_filename: str):
-        """清理项目目录中可能存在的旧视频文件，防止缓存混淆"""
-        try:
-            # 清理可能存在的同名文件
-            old_file = Config.VIDEO_CLIPS_DIR / f"{video_filename}.mp4"
-            if old_file.exists():
-                old_file.unlink()
-                print(f"🗑️ 清理旧文件: {old_file}")
-            
-            # 清理带有相似名称的文件（防止时间戳重复）
-            base_name = video_filename.split('_')[0] if '_' in video_filename else video_filename
-            for old_file in Config.VIDEO_CLIPS_DIR.glob(f"{base_name}_*.mp4"):
-                if old_file.name != f"{video_filename}.mp4":
-                    try:
-                        # 检查文件是否太新（5分钟内），如果是则不删除
-                        import time
-                        if time.time() - old_file.stat().st_mtime > 300:  # 5分钟
-                            old_file.unlink()
-                            print(f"🗑️ 清理历史文件: {old_file}")
-                        else:
-                            print(f"⏳ 保留最近文件: {old_file}")
-                    except Exception as e:
-                        print(f"⚠️ 清理文件失败: {old_file} - {e}")
-                        
-        except Exception as e:
-            print(f"⚠️ 清理旧文件异常: {str(e)}")
-    
-    def _copy_video_file_simple(self, source_path: Path, video_filename: str) -> Optional[str]:
-        """简化的视频文件复制"""
-        try:
-            import shutil
-            
-            print(f"\n=== 复制视频文件 ===")
-            print(f"源文件: {source_path}")
-            print(f"源文件扩展名: {source_path.suffix}")
-            print(f"源文件大小: {source_path.stat().st_size/1024/1024:.2f}MB")
-            print(f"目标文件名: {video_filename}")
-            
-            # 验证源文件是视频文件
-            if source_path.suffix.lower() not in ['.mp4', '.avi', '.mov', '.mkv']:
-                print(f"⚠️ 警告：源文件不是视频格式: {source_path.suffix}")
-                print(f"但继续复制，可能是ComfyUI的输出文件命名问题")
-            
-            # 目标路径 - 确保使用.mp4扩展名
-            dest_path = Config.VIDEO_CLIPS_DIR / f"{video_filename}.mp4"
-            print(f"目标路径: {dest_path}")
-            
-            # 确保目录存在
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # 复制文件
-            print(f"开始复制文件...")
-            shutil.copy2(source_path, dest_path)
-            
-            # 等待一下确保复制完成
-            import time
-            time.sleep(0.5)
-            
-            # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功复制视频: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                print(f"文件扩展名: {dest_path.suffix}")
-                print(f"=========================\n")
-                return str(dest_path)
-            else:
-                print(f"✗ 文件复制失败或文件为空")
-                print(f"=========================\n")
-                return None
-                
-        except Exception as e:
-            print(f"复制视频文件异常: {str(e)}")
-            print(f"=========================\n")
-            return None
+    def _get_comfyui_output_files(self) -> Dict[str, float]:
         """获取ComfyUI output目录中的所有文件及其修改时间"""
         try:
-            comfyui_output_dir = Path("F:/ComfyUI_windows_portable/ComfyUI/output")
+            comfyui_output_dir = self._comfyui_output_dir
             if not comfyui_output_dir.exists():
                 return {}
             
             files_info = {}
-            # 获取所有视频文件
-            for ext in ['*.mp4', '*.avi', '*.mov', '*.mkv']:
-                for file_path in comfyui_output_dir.glob(ext):
-                    files_info[str(file_path)] = file_path.stat().st_mtime
+            # 获取所有视频文件（单次遍历，修改时间直接取自目录条目）
+            for entry in _scan_files_by_ext(comfyui_output_dir, _VIDEO_EXTS):
+                files_info[entry.path] = entry.stat().st_mtime
             
             return files_info
         except Exception as e:
-            print(f"获取文件列表失败: {str(e)}")
+            logger.warning("获取文件列表失败: %s", e)
             return {}
     
-    def _execute_workflow_with_file_tracking(self, workflow: Dict, filename: str, files_before: Dict[str, float]) -> Optional[str]:
+    def _execute_workflow_with_file_tracking(self, workflow: Dict, filename: str) -> Optional[str]:
         """执行ComfyUI工作流并跟踪新生成的文件"""
+        # 记录提交时间，之后修改时间晚于它的输出文件即为本次生成
+        started_at = time.time()
         try:
             # 队列提示
             prompt_id = self._queue_prompt(workflow)
@@ -1333,6107 +1263,1188 @@ class ComfyUIService:
                     return api_result
             
             # API失败，使用文件跟踪方式
-            print(f"⚠️ API保存失败，使用文件跟踪方式...")
-            return self._find_new_video_file(files_before, filename)
+            logger.warning("⚠️ API保存失败，使用文件跟踪方式...")
+            return self._find_new_video_file(started_at, filename)
             
         except Exception as e:
-            print(f"执行工作流异常: {str(e)}")
+            logger.error("执行工作流异常: %s", e)
             # 如果有异常，也尝试文件跟踪
-            return self._find_new_video_file(files_before, filename)
+            return self._find_new_video_file(started_at, filename)
     
-    def _find_new_video_file(self, files_before: Dict[str, float], filename: str) -> Optional[str]:
-        """查找新生成的视频文件"""
+    def _find_new_video_file(self, since: float, filename: str) -> Optional[str]:
+        """查找since之后新生成或修改的视频文件"""
         try:
-            import time
-            # 等待一下让ComfyUI完成文件写入
-            time.sleep(2)
-            
-            files_after = self._get_comfyui_output_files()
+            # 扫描一次目录，按修改时间取since之后最新的文件
+            # （完成事件在输出节点写完文件后才发出，无需再等待文件写入）
+            candidates = heapq.nlargest(
+                10,
+                ((file_path, mtime) for file_path, mtime in self._get_comfyui_output_files().items() if mtime > since),
+                key=lambda item: item[1]
+            )
             
-            # 找出新增的文件
+            # 取得每个候选文件的大小: [(路径, 大小)]，保持修改时间倒序，跳过已被删除的文件
             new_files = []
-            for file_path, mtime in files_after.items():
-                if file_path not in files_before:
-                    # 全新文件
-                    new_files.append((file_path, mtime, 'new'))
-                elif mtime > files_before[file_path]:
-                    # 修改过的文件
-                    new_files.append((file_path, mtime, 'modified'))
+            for file_path, mtime in candidates:
+                try:
+                    new_files.append((Path(file_path), os.stat(file_path).st_size))
+                except FileNotFoundError:
+                    pass
             
             if not new_files:
-                print(f"✗ 未找到新生成的视频文件")
+                logger.warning("✗ 未找到新生成的视频文件")
                 return None
             
-            print(f"找到 {len(new_files)} 个新/修改的文件:")
-            for file_path, mtime, status in new_files:
-                file_obj = Path(file_path)
-                size = file_obj.stat().st_size / 1024 / 1024
-                print(f"  {file_obj.name} ({size:.2f}MB, {status})")
-            
-            # 选择最新的文件（按修改时间）
-            latest_file = max(new_files, key=lambda x: x[1])
-            latest_path = Path(latest_file[0])
-            
-            # 检查文件大小
-            file_size = latest_path.stat().st_size
-            if file_size < 100 * 1024:  # 小于100KB
-                print(f"⚠️ 最新文件太小 ({file_size/1024:.1f}KB)，可能生成失败")
-                # 尝试找更大的文件
-                valid_files = [(f, m, s) for f, m, s in new_files if Path(f).stat().st_size > 100 * 1024]
-                if valid_files:
-                    # 选择最新的有效文件
-                    latest_file = max(valid_files, key=lambda x: x[1])
-                    latest_path = Path(latest_file[0])
-                    print(f"使用最新的有效文件: {latest_path.name}")
-            
-            print(f"选择文件: {latest_path}")
+            logger.info("找到 %s 个新/修改的文件:", len(new_files))
+            for file_obj, size in new_files:
+                logger.debug("  %s (%.2fMB)", file_obj.name, size * _MB)
+            
+            # 选择最新的有效文件（大于100KB），都太小时仍使用最新的文件
+            latest_path, file_size = next(
+                ((f, size) for f, size in new_files if size > 100 * 1024), new_files[0]
+            )
+            if latest_path != new_files[0][0]:
+                logger.warning("⚠️ 最新文件太小 (%.1fKB)，可能生成失败", new_files[0][1] / 1024)
+                logger.info("使用最新的有效文件: %s", latest_path.name)
+            elif file_size <= 100 * 1024:
+                logger.warning("⚠️ 最新文件太小 (%.1fKB)，可能生成失败", file_size / 1024)
+            
+            logger.info("选择文件: %s", latest_path)
             
             # 复制到项目目录
             return self._copy_video_file(latest_path, filename)
             
         except Exception as e:
-            print(f"查找新文件异常: {str(e)}")
+            logger.error("查找新文件异常: %s", e)
             return None
     
     def _copy_video_file(self, source_path: Path, filename: str) -> Optional[str]:
         """复制视频文件到项目目录"""
         try:
-            import shutil
-            
             # 目标路径
             dest_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
             
-            # 确保目录存在
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # 复制文件
-            shutil.copy2(source_path, dest_path)
-            
-            # 等待一下确保复制完成
-            import time
-            time.sleep(0.5)
+            # 同一分区时硬链接，否则复制文件
+            self._link_or_copy(source_path, dest_path)
             
             # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功复制视频: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
+            st = _stat_or_none(dest_path)
+            if st and st.st_size > 0:
+                file_size = st.st_size
+                logger.info("✅ 成功复制视频: %s", dest_path)
+                logger.info("文件大小: %.2fMB", file_size * _MB)
                 return str(dest_path)
             else:
-                print(f"✗ 文件复制失败或文件为空")
+                logger.warning("✗ 文件复制失败或文件为空")
                 return None
                 
         except Exception as e:
-            print(f"复制视频文件异常: {str(e)}")
+            logger.error("复制视频文件异常: %s", e)
             return None
     
     def _encode_image_to_base64(self, image_path: str) -> str:
         """将图片编码为base64"""
         try:
             with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return encoded_string
-        except Exception as e:
-            print(f"图片编码失败: {str(e)}")
-            return ""
-        """将图片编码为base64"""
-        try:
-            with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return encoded_string
+                return base64.b64encode(image_file.read()).decode('utf-8')
         except Exception as e:
-            print(f"图片编码失败: {str(e)}")
+            logger.warning("图片编码失败: %s", e)
             return ""
     
     def _find_latest_generated_image(self, filename: str) -> Optional[str]:
         """从 ComfyUI 输出目录查找最新生成的图片"""
         try:
-            import time
-            # 等待一下让ComfyUI完成文件写入
-            time.sleep(2)
+            # 等待ComfyUI完成文件写入
+            get_output_watcher(self._comfyui_output_dir).wait_quiet(quiet=0.5, timeout=2)
             
-            comfyui_output_dir = Path("F:/ComfyUI_windows_portable/ComfyUI/output")
+            comfyui_output_dir = self._comfyui_output_dir
             if not comfyui_output_dir.exists():
-                print(f"✗ ComfyUI output目录不存在: {comfyui_output_dir}")
+                logger.warning("✗ ComfyUI output目录不存在: %s", comfyui_output_dir)
                 return None
             
-            print(f"\n=== 查找最新生成的图片 ===")
-            print(f"搜索目录: {comfyui_output_dir}")
+            logger.info("\n=== 查找最新生成的图片 ===")
+            logger.info("搜索目录: %s", comfyui_output_dir)
             
-            # 查找所有图片文件
-            image_files = []
-            for ext in ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.webp']:
-                found_files = list(comfyui_output_dir.glob(ext))
-                image_files.extend(found_files)
-                if found_files:
-                    print(f"找到 {len(found_files)} 个 {ext} 文件")
+            # 查找所有图片文件（单次遍历，文件信息直接取自目录条目）
+            image_entries = _scan_files_by_ext(comfyui_output_dir, _IMAGE_EXTS)
             
-            if not image_files:
-                print(f"✗ 未找到任何图片文件")
+            if not image_entries:
+                logger.warning("✗ 未找到任何图片文件")
                 return None
             
-            print(f"总共找到 {len(image_files)} 个图片文件")
+            logger.info("总共找到 %s 个图片文件", len(image_entries))
             
             # 按修改时间排序，选择最新的
-            image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            image_entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
             
             # 选择最新的有效图片（大于50KB）
-            for image_file in image_files[:5]:  # 只检查最新的5个文件
-                file_size = image_file.stat().st_size
-                file_time = time.ctime(image_file.stat().st_mtime)
-                print(f"检查文件: {image_file.name} ({file_size/1024:.1f}KB, {file_time})")
+            for entry in image_entries[:5]:  # 只检查最新的5个文件
+                entry_stat = entry.stat()
+                file_size = entry_stat.st_size
+                file_time = time.ctime(entry_stat.st_mtime)
+                logger.debug("检查文件: %s (%.1fKB, %s)", entry.name, file_size / 1024, file_time)
                 
                 if file_size > 50 * 1024:  # 大于50KB
-                    print(f"✅ 选择最新的有效图片: {image_file.name}")
+                    logger.info("✅ 选择最新的有效图片: %s", entry.name)
                     
                     # 复制到项目目录
-                    return self._copy_image_file(image_file, filename)
+                    return self._copy_image_file(Path(entry.path), filename)
             
-            print(f"✗ 未找到有效的图片文件（大于50KB）")
+            logger.warning("✗ 未找到有效的图片文件（大于50KB）")
             return None
             
         except Exception as e:
-            print(f"查找最新图片异常: {str(e)}")
+            logger.error("查找最新图片异常: %s", e)
             return None
     
     def _copy_image_file(self, source_path: Path, filename: str) -> Optional[str]:
         """复制图片文件到项目目录"""
         try:
-            import shutil
-            
-            print(f"\n=== 复制图片文件 ===")
-            print(f"源文件: {source_path}")
-            print(f"源文件大小: {source_path.stat().st_size/1024/1024:.2f}MB")
+            logger.info("\n=== 复制图片文件 ===")
+            logger.info("源文件: %s", source_path)
+            # 文件大小只用于调试日志，未开启DEBUG时不做stat
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("源文件大小: %.2fMB", source_path.stat().st_size * _MB)
             
             # 目标路径 - 使用原始扩展名
             dest_path = Config.STORYBOARD_DIR / f"{filename}{source_path.suffix}"
-            print(f"目标路径: {dest_path}")
-            
-            # 确保目录存在
-            Config.STORYBOARD_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # 复制文件
-            print(f"开始复制文件...")
-            shutil.copy2(source_path, dest_path)
+            logger.info("目标路径: %s", dest_path)
             
-            # 等待一下确保复制完成
-            import time
-            time.sleep(0.5)
+            # 同一分区时硬链接，否则复制文件
+            logger.info("开始复制文件...")
+            self._link_or_copy(source_path, dest_path)
             
             # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功复制图片: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                print(f"=========================\n")
+            st = _stat_or_none(dest_path)
+            if st and st.st_size > 0:
+                file_size = st.st_size
+                logger.info("✅ 成功复制图片: %s", dest_path)
+                logger.info("文件大小: %.2fMB", file_size * _MB)
+                logger.info("=========================\n")
                 return str(dest_path)
             else:
-                print(f"✗ 文件复制失败或文件为空")
+                logger.warning("✗ 文件复制失败或文件为空")
                 return None
                 
         except Exception as e:
-            print(f"复制图片文件异常: {str(e)}")
+            logger.error("复制图片文件异常: %s", e)
             return None
 
-    def _execute_workflow(self, workflow: Dict, filename: str) -> Optional[str]:
-        """执行ComfyUI工作流"""
-        try:
-            # 队列提示
-            prompt_id = self._queue_prompt(workflow)
-            if not prompt_id:
+    def generate_videos(self, image_paths: List[str], video_prompts: List[str], video_params: Dict = None) -> List[str]:
+        """将图片转换为视频片段"""
+        video_paths = []
+        
+        logger.info("开始生成 %s 个视频片段...", len(image_paths))
+        if video_params:
+            logger.info("视频参数: %s", video_params)
+        
+        # 检查输入参数
+        if len(image_paths) != len(video_prompts):
+            logger.warning("⚠️ 警告：图片数量(%s)与提示词数量(%s)不匹配", len(image_paths), len(video_prompts))
+            min_count = min(len(image_paths), len(video_prompts))
+            image_paths = image_paths[:min_count]
+            video_prompts = video_prompts[:min_count]
+            logger.info("自动裁剪到 %s 个", min_count)
+        
+        max_retries = 3
+        
+        # 检查ComfyUI服务状态
+        if not self.check_connection():
+            logger.error("❌ ComfyUI服务未运行，请先启动ComfyUI服务")
+            # 尝试恢复服务
+            if not self._attempt_service_recovery():
+                # 填充结果列表为None
+                return [None] * len(image_paths)
+        
+        # 生成前把已有的长期对象（模块、配置、会话等）移入永久代，生成过程中的分代GC不再反复扫描它们；
+        # 自动GC保持开启，其他线程照常回收循环引用，结束后解除冻结并回收一次
+        gc.freeze()
+        try:
+            if len(self.base_urls) > 1:
+                # 多个后端时并行分发，每个后端同一时间只处理一个任务
+                video_paths = self._generate_videos_parallel(image_paths, video_prompts, video_params, max_retries)
+            else:
+                # 单个后端时流水线提交，等待当前任务时下一个任务已在ComfyUI队列中
+                video_paths = self._generate_videos_pipelined(image_paths, video_prompts, video_params, max_retries)
+        finally:
+            gc.unfreeze()
+            gc.collect()
+        
+        success_count = sum(1 for path in video_paths if path)
+        
+        logger.info("\n=== 视频生成总结 ===")
+        logger.info("成功生成: %s/%s 个视频片段", success_count, len(image_paths))
+        
+        if success_count == 0:
+            logger.error("❌ 所有视频生成失败！")
+        elif success_count < len(image_paths):
+            logger.warning("⚠️ 部分成功：%s个视频生成失败", len(image_paths) - success_count)
+        else:
+            logger.info("🎉 所有视频生成成功！")
+        
+        return video_paths
+    
+    def _generate_videos_parallel(self, image_paths: List[str], video_prompts: List[str],
+                                  video_params: Dict = None, max_retries: int = 3,
+                                  gc_interval: int = 10) -> List[Optional[str]]:
+        """将视频任务分发到多个ComfyUI后端并行生成，结果按原始顺序返回"""
+        logger.info("🔀 使用 %s 个ComfyUI后端并行生成: %s", len(self.base_urls), ', '.join(self.base_urls))
+        
+        # 空闲后端队列，工作线程取出一个后端执行任务，完成后归还
+        idle_backends = queue.Queue()
+        for base_url in self.base_urls:
+            idle_backends.put(base_url)
+        
+        def worker(image_path: str, prompt: str) -> Optional[str]:
+            base_url = idle_backends.get()
+            try:
+                return self._generate_single_video(image_path, prompt, video_params, max_retries, base_url=base_url)
+            finally:
+                idle_backends.put(base_url)
+        
+        video_paths = [None] * len(image_paths)
+        completed = 0
+        with ThreadPoolExecutor(max_workers=len(self.base_urls)) as executor:
+            futures = {
+                executor.submit(worker, image_path, prompt): i
+                for i, (image_path, prompt) in enumerate(zip(image_paths, video_prompts))
+            }
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    video_paths[i] = future.result()
+                except Exception as e:
+                    logger.error("❌ 第%s个视频并行生成异常: %s", i + 1, e)
+                completed += 1
+                if completed % gc_interval == 0:
+                    gc.collect(2)
+        
+        return video_paths
+    
+    def _generate_videos_pipelined(self, image_paths: List[str], video_prompts: List[str],
+                                   video_params: Dict = None, max_retries: int = 3,
+                                   max_inflight: int = 2, gc_interval: int = 10) -> List[Optional[str]]:
+        """在单个ComfyUI后端上流水线生成视频：提前入队下一个任务，避免任务间GPU空闲"""
+        video_paths = [None] * len(image_paths)
+        pending = deque(enumerate(zip(image_paths, video_prompts)))
+        # 已提交到ComfyUI队列的任务: (索引, prompt_id, 视频文件名, 时间戳)
+        inflight = deque()
+        completed = 0
+        
+        while pending or inflight:
+            # 补足在途任务，ComfyUI会按入队顺序依次执行
+            while pending and len(inflight) < max_inflight:
+                i, (image_path, prompt) = pending.popleft()
+                logger.info("\n--- 提交第%s/%s个视频 ---", i + 1, len(image_paths))
+                logger.info("源图片: %s", image_path)
+                logger.info("视频提示词: %s", prompt)
+                
+                if not image_path or not Path(image_path).exists():
+                    logger.error("❌ 图片文件不存在，跳过: %s", image_path)
+                    continue
+                
+                video_filename, timestamp = self._make_video_filename(image_path)
+                prompt_id = None
+                try:
+                    workflow = self.load_workflow(Config.VIDEO_WORKFLOW)
+                    workflow = self._update_video_workflow(workflow, image_path, prompt, video_params)
+                    prompt_id = self._queue_prompt(workflow)
+                    # 工作流已提交，立即释放引用
+                    del workflow
+                except Exception as e:
+                    logger.error("❌ 提交视频任务异常: %s", e)
+                inflight.append((i, prompt_id, video_filename, timestamp))
+            
+            if not inflight:
+                break
+            
+            # 等待队首任务完成，此时后续任务已在ComfyUI中排队
+            i, prompt_id, video_filename, timestamp = inflight.popleft()
+            logger.info("\n=== 等待第%s/%s个视频完成 ===", i + 1, len(image_paths))
+            video_path = None
+            if prompt_id:
+                video_path = self._collect_video_output(prompt_id, video_filename, timestamp)
+            
+            st = _stat_or_none(video_path) if video_path else None
+            if st and st.st_size >= 1024:
+                logger.info("✅ 视频片段生成成功: %s", video_path)
+            else:
+                # 流水线提交失败时走带重试的逐个生成，重试期间已入队的任务仍在执行
+                logger.warning("⚠️ 第%s个视频流水线生成失败，进入重试", i + 1)
+                video_path = self._generate_single_video(image_paths[i], video_prompts[i], video_params,
+                                                         max(max_retries - 1, 1))
+            video_paths[i] = video_path
+            
+            self._check_system_resources()
+            completed += 1
+            if completed % gc_interval == 0:
+                gc.collect(2)
+        
+        return video_paths
+    
+    def _make_video_filename(self, image_path: str):
+        """生成唯一的视频文件名：图片名 + 微秒时间戳 + 随机数，返回 (文件名, 时间戳)"""
+        image_name = Path(image_path).stem  # 不带扩展名的文件名
+        timestamp = int(time.time() * 1000000)  # 微秒级时间戳
+        unique_id = str(uuid.uuid4())[:8]  # 8位随机字符
+        video_filename = f"{image_name}_{timestamp}_{unique_id}"
+        
+        logger.info("生成唯一视频文件名: %s", video_filename)
+        logger.info("时间戳: %s, UUID前缀: %s", timestamp, unique_id)
+        return video_filename, timestamp
+    
+    def _generate_single_video(self, image_path: str, prompt: str, video_params: Dict = None,
+                               max_retries: int = 3, base_url: Optional[str] = None) -> Optional[str]:
+        """在指定的ComfyUI后端上生成单个视频片段，带重试"""
+        base_url = base_url or self.base_url
+        try:
+            logger.info("源图片: %s", image_path)
+            logger.info("视频提示词: %s", prompt)
+            if base_url != self.base_url:
+                logger.info("ComfyUI后端: %s", base_url)
+            
+            # 检查系统资源
+            self._check_system_resources()
+            
+            # 检查图片文件是否存在
+            if not image_path or not Path(image_path).exists():
+                logger.error("❌ 图片文件不存在，跳过: %s", image_path)
                 return None
             
-            # 等待完成
-            output_images = self._wait_for_completion(prompt_id)
+            video_filename, timestamp = self._make_video_filename(image_path)
             
-            if output_images:
-                # 保存输出文件
-                saved_path = self._save_output(output_images, filename)
-                if saved_path:
-                    return saved_path
-                else:
-                    print(f"⚠️ API保存失败，尝试从输出目录查找...")
-                    # 根据filename判断是音频还是图片
-                    if filename.startswith('audio_'):
-                        # 音频文件，查找最新生成的音频
-                        return self._find_latest_generated_audio(filename)
+            # 重试机制
+            video_path = None
+            last_error = None
+            
+            for retry in range(max_retries):
+                try:
+                    # 检查ComfyUI服务状态
+                    if not self.check_connection(base_url=base_url):
+                        logger.error("❌ ComfyUI服务连接失败")
+                        # 只能自动恢复本机的ComfyUI服务
+                        if base_url != self.base_url or not self._attempt_service_recovery():
+                            last_error = "ComfyUI服务无法连接"
+                            break
+                    
+                    if retry > 0:
+                        logger.info("🔄 第%s次重试 (共%s次)...", retry, max_retries - 1)
+                        # 重试前等待更长时间
+                        wait_time = 15 * retry  # 递增等待时间
+                        logger.info("⏳ 等待 %s 秒后重试...", wait_time)
+                        time.sleep(wait_time)
+                    
+                    # 加载视频生成工作流
+                    workflow = self.load_workflow(Config.VIDEO_WORKFLOW)
+                    
+                    # 修改工作流，传递视频参数
+                    workflow = self._update_video_workflow(workflow, image_path, prompt, video_params)
+                    
+                    # 执行工作流
+                    video_path = self._execute_workflow_simple(workflow, video_filename, timestamp, base_url=base_url)
+                    
+                    st = _stat_or_none(video_path) if video_path else None
+                    if st:
+                        # 检查文件大小
+                        file_size = st.st_size
+                        logger.info("文件大小: %.2f MB", file_size / (1024 * 1024))
+                        
+                        if file_size >= 1024:  # 大于1KB才认为成功
+                            break  # 成功，跳出重试循环
+                        else:
+                            logger.warning("⚠️ 警告：视频文件太小，可能生成失败")
+                            last_error = "视频文件太小"
                     else:
-                        # 图片文件，查找最新生成的图片
-                        return self._find_latest_generated_image(filename)
+                        last_error = "视频文件未生成"
+                        
+                except Exception as e:
+                    last_error = str(e)
+                    logger.error("❌ 生成视频片段异常 (尝试%s/%s): %s", retry + 1, max_retries, e)
+                    if retry < max_retries - 1:  # 不是最后一次尝试
+                        logger.info("等待ComfyUI服务恢复...")
+                        # 重试前等待更长时间
+                        wait_time = 20 * (retry + 1)  # 递增等待时间
+                        logger.info("⏳ 等待 %s 秒后重试...", wait_time)
+                        time.sleep(wait_time)
             
+            if video_path and Path(video_path).exists():
+                logger.info("✅ 视频片段生成成功: %s", video_path)
+                return video_path
+            logger.error("❌ 视频片段生成失败: %s", last_error)
             return None
-            
+                
         except Exception as e:
-            print(f"执行工作流失败: {str(e)}")
+            logger.error("❌ 处理视频片段异常: %s", e)
+            traceback.print_exc()
+            return None
+
+    def _wait_for_completion(self, prompt_id: str, timeout: int = 900, base_url: Optional[str] = None) -> Optional[Dict]:
+        """等待工作流完成 - 优先订阅WebSocket完成事件，不可用时回退到HTTP轮询"""
+        base_url = base_url or self.base_url
+        deadline = time.time() + timeout
+        
+        if websocket is not None:
+            try:
+                outputs = self._wait_for_completion_ws(prompt_id, deadline, base_url=base_url)
+                if outputs is not None:
+                    return outputs
+            except Exception as e:
+                logger.error("WebSocket等待异常，回退到轮询: %s", e)
+        
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            logger.info("工作流执行超时 (%s秒)", timeout)
             return None
+        return self._poll_for_completion(prompt_id, remaining, base_url=base_url)
     
-    def _queue_prompt(self, workflow: Dict) -> Optional[str]:
-        """提交工作流到队列"""
-        try:
-            prompt_data = {
-                "prompt": workflow,
-                "client_id": self.client_id
-            }
-            
-            print(f"\n=== 提交工作流到ComfyUI ===")
-            print(f"Client ID: {self.client_id}")
-            print(f"URL: {self.base_url}/prompt")
-            print(f"工作流节点数量: {len(workflow)}")
-            
-            # 显示工作流的前几个节点信息
-            for i, (node_id, node_data) in enumerate(list(workflow.items())[:3]):
-                print(f"Node {node_id}: {node_data.get('class_type', 'Unknown')}")
-                if 'inputs' in node_data:
-                    for key, value in list(node_data['inputs'].items())[:3]:
-                        if isinstance(value, str) and len(value) > 50:
-                            print(f"  {key}: {value[:50]}...")
-                        else:
-                            print(f"  {key}: {value}")
-            
-            response = requests.post(
-                f"{self.base_url}/prompt",
-                json=prompt_data,
-                timeout=30
-            )
-            
-            print(f"响应状态码: {response.status_code}")
-            
-            if response.status_code == 200:
-                result = response.json()
-                prompt_id = result.get("prompt_id")
-                print(f"Prompt ID: {prompt_id}")
-                print(f"=========================\n")
-                return prompt_id
-            else:
-                print(f"错误响应: {response.text}")
-                
-                # 尝试解析错误信息
+    def _wait_for_completion_ws(self, prompt_id: str, deadline: float, base_url: Optional[str] = None) -> Optional[Dict]:
+        """通过ComfyUI的WebSocket接收执行事件，任务完成后只查询一次历史记录"""
+        base_url = base_url or self.base_url
+        ws_url = f"{base_url.replace('http', 'ws', 1)}/ws?clientId={self.client_id}"
+        ws = websocket.WebSocket()
+        try:
+            ws.settimeout(30)
+            ws.connect(ws_url)
+            
+            # 任务可能在连接建立前就已完成，先检查一次
+            outputs = self._fetch_history_outputs(prompt_id, base_url=base_url)
+            if outputs is not None:
+                return outputs
+            
+            while time.time() < deadline:
+                ws.settimeout(max(1, min(30, deadline - time.time())))
                 try:
-                    error_data = response.json()
-                    print(f"错误详情: {json.dumps(error_data, indent=2, ensure_ascii=False)}")
-                except:
-                    print(f"无法解析错误响应")
+                    message = ws.recv()
+                except websocket.WebSocketTimeoutException:
+                    # 长时间没有事件时核对一次历史记录，防止错过完成消息
+                    outputs = self._fetch_history_outputs(prompt_id, base_url=base_url)
+                    if outputs is not None:
+                        return outputs
+                    continue
                 
-                print(f"=========================\n")
-                return None
+                # 跳过预览图等二进制消息
+                if not isinstance(message, str):
+                    continue
                 
-        except Exception as e:
-            print(f"提交工作流异常: {str(e)}")
-            print(f"=========================\n")
+                event = _json_loads(message)
+                event_type = event.get("type")
+                data = event.get("data") or {}
+                if data.get("prompt_id") != prompt_id:
+                    continue
+                
+                if event_type == "executing" and data.get("node") is None:
+                    # node为空表示该prompt的全部节点执行完毕
+                    return self._fetch_history_outputs(prompt_id, base_url=base_url)
+                if event_type == "execution_error":
+                    logger.info("工作流执行出错: %s", data.get('exception_message', ''))
+                    return self._fetch_history_outputs(prompt_id, base_url=base_url)
+            
+            logger.info("等待WebSocket完成事件超时")
             return None
+        finally:
+            ws.close()
+    
+    def _fetch_history_outputs(self, prompt_id: str, base_url: Optional[str] = None) -> Optional[Dict]:
+        """查询一次 /history，任务尚未完成时返回None"""
+        base_url = base_url or self.base_url
+        response = self.session.get(f"{base_url}/history/{prompt_id}", timeout=30)
+        if response.status_code == 200:
+            history = _json_loads(response.content)
+            if prompt_id in history:
+                return history[prompt_id].get("outputs", {})
+        return None
     
-    def _wait_for_completion(self, prompt_id: str, timeout: int = 900) -> Optional[Dict]:
-        """等待工作流完成 - 增加超时时间到15分钟"""
+    def _poll_for_completion(self, prompt_id: str, timeout: float = 900, base_url: Optional[str] = None) -> Optional[Dict]:
+        """轮询等待工作流完成，检查间隔按指数退避从1秒增加到10秒"""
+        base_url = base_url or self.base_url
         start_time = time.time()
-        
-        # 增加初始等待时间，让ComfyUI有时间开始处理
-        time.sleep(2)
+        delay = 1.0
         
         while time.time() - start_time < timeout:
             try:
-                # 检查队列状态
-                response = requests.get(f"{self.base_url}/history/{prompt_id}", timeout=30)
-                
-                if response.status_code == 200:
-                    history = response.json()
-                    
-                    if prompt_id in history:
-                        # 任务完成
-                        outputs = history[prompt_id].get("outputs", {})
-                        return outputs
-                else:
-                    print(f"错误响应: {response.text}")
-                    return None
-                
+                outputs = self._batch_check_completion({prompt_id}, base_url=base_url)[prompt_id]
+                if outputs is not None:
+                    # 任务完成
+                    return outputs
             except Exception as e:
-                print(f"检查队列状态异常: {str(e)}")
-                return None
+                logger.error("检查状态异常: %s", e)
+            
+            # 逐渐增加等待时间，避免频繁请求
+            time.sleep(min(delay, max(timeout - (time.time() - start_time), 0)))
+            delay = min(delay * 1.5, 10.0)
+        
+        logger.info("工作流执行超时 (%.0f秒)", timeout)
+        return None
     
-    def _save_output(self, output_images: Dict, filename: str) -> Optional[str]:
+    def _batch_check_completion(self, prompt_ids, base_url: Optional[str] = None) -> Dict[str, Optional[Dict]]:
+        """一次 /queue 查询所有在途任务的状态，只对已离开队列的任务查询 /history，未完成的返回None"""
+        base_url = base_url or self.base_url
+        response = self.session.get(f"{base_url}/queue", timeout=30)
+        queue_info = _json_loads(response.content) if response.status_code == 200 else {}
+        # 队列条目格式: [序号, prompt_id, prompt, extra_data, outputs_to_execute]
+        queued = {item[1] for item in queue_info.get("queue_running", []) + queue_info.get("queue_pending", [])}
+        return {
+            prompt_id: None if prompt_id in queued else self._fetch_history_outputs(prompt_id, base_url=base_url)
+            for prompt_id in prompt_ids
+        }
+
+    def _save_output(self, outputs: Dict, filename: str, base_url: Optional[str] = None) -> Optional[str]:
         """保存输出文件"""
+        base_url = base_url or self.base_url
         try:
-            import base64
-            
-            print(f"\n=== 保存输出文件 ===")
-            print(f"文件名: {filename}")
-            print(f"输出图片数量: {len(output_images)}")
-            
-            if len(output_images) == 0:
-                print(f"✗ 未找到任何输出图片")
-                return None
-            
-            # 选择第一个输出图片
-            output_image = output_images[0]
-            image_data = output_image[0]
-            image_format = output_image[1]
-            image_name = output_image[2]
-            
-            print(f"选择图片: {image_name}")
-            print(f"图片格式: {image_format}")
-            
-            # 生成目标路径
-            dest_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            print(f"目标路径: {dest_path}")
-            
-            # 确保目录存在
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
+            logger.info("\n=== 保存ComfyUI输出 ===")
+            logger.info("文件名: %s", filename)
+            logger.info("输出节点: %s", list(outputs.keys()))
             
-            # 解码base64数据并保存文件
-            with open(dest_path, "wb") as output_file:
-                output_file.write(base64.b64decode(image_data))
+            # 显示输出详情
+            video_combine_node = None  # 视频合并节点（通常是节点13）
             
-            # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功保存视频: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                return str(dest_path)
-            else:
-                print(f"✗ 文件保存失败或文件为空")
-                return None
+            for node_id, node_output in outputs.items():
+                logger.info("Node %s: %s", node_id, list(node_output.keys()))
                 
-        except Exception as e:
-            print(f"保存输出文件异常: {str(e)}")
-            return None
-    
-    def _get_comfyui_output_files(self) -> Dict[str, float]:
-        """获取ComfyUI output目录中的所有文件及其修改时间"""
-        try:
-            comfyui_output_dir = Path("F:/ComfyUI_windows_portable/ComfyUI/output")
-            if not comfyui_output_dir.exists():
-                return {}
-            
-            files_info = {}
-            # 获取所有视频文件
-            for ext in ['*.mp4', '*.avi', '*.mov', '*.mkv']:
-                for file_path in comfyui_output_dir.glob(ext):
-                    files_info[str(file_path)] = file_path.stat().st_mtime
-            
-            return files_info
-        except Exception as e:
-            print(f"获取文件列表失败: {str(e)}")
-            return {}
-    
-    def _execute_workflow_with_file_tracking(self, workflow: Dict, filename: str, files_before: Dict[str, float]) -> Optional[str]:
-        """执行ComfyUI工作流并跟踪新生成的文件"""
-        try:
-            # 队列提示
-            prompt_id = self._queue_prompt(workflow)
-            if not prompt_id:
-                return None
-            
-            # 等待完成
-            output_images = self._wait_for_completion(prompt_id)
-            
-            if output_images:
-                # 首先尝试通过API保存
-                api_result = self._save_output(output_images, filename)
-                if api_result:
-                    return api_result
-            
-            # API失败，使用文件跟踪方式
-            print(f"⚠️ API保存失败，使用文件跟踪方式...")
-            return self._find_new_video_file(files_before, filename)
-            
-        except Exception as e:
-            print(f"执行工作流异常: {str(e)}")
-            # 如果有异常，也尝试文件跟踪
-            return self._find_new_video_file(files_before, filename)
-    
-    def _find_new_video_file(self, files_before: Dict[str, float], filename: str) -> Optional[str]:
-        """查找新生成的视频文件"""
-        try:
-            import time
-            # 等待一下让ComfyUI完成文件写入
-            time.sleep(2)
-            
-            files_after = self._get_comfyui_output_files()
-            
-            # 找出新增的文件
-            new_files = []
-            for file_path, mtime in files_after.items():
-                if file_path not in files_before:
-                    # 全新文件
-                    new_files.append((file_path, mtime, 'new'))
-                elif mtime > files_before[file_path]:
-                    # 修改过的文件
-                    new_files.append((file_path, mtime, 'modified'))
-            
-            if not new_files:
-                print(f"✗ 未找到新生成的视频文件")
-                return None
-            
-            print(f"找到 {len(new_files)} 个新/修改的文件:")
-            for file_path, mtime, status in new_files:
-                file_obj = Path(file_path)
-                size = file_obj.stat().st_size / 1024 / 1024
-                print(f"  {file_obj.name} ({size:.2f}MB, {status})")
-            
-            # 选择最新的文件（按修改时间）
-            latest_file = max(new_files, key=lambda x: x[1])
-            latest_path = Path(latest_file[0])
-            
-            # 检查文件大小
-            file_size = latest_path.stat().st_size
-            if file_size < 100 * 1024:  # 小于100KB
-                print(f"⚠️ 最新文件太小 ({file_size/1024:.1f}KB)，可能生成失败")
-                # 尝试找更大的文件
-                valid_files = [(f, m, s) for f, m, s in new_files if Path(f).stat().st_size > 100 * 1024]
-                if valid_files:
-                    # 选择最新的有效文件
-                    latest_file = max(valid_files, key=lambda x: x[1])
-                    latest_path = Path(latest_file[0])
-                    print(f"使用最新的有效文件: {latest_path.name}")
-            
-            print(f"选择文件: {latest_path}")
-            
-            # 复制到项目目录
-            return self._copy_video_file(latest_path, filename)
-            
-        except Exception as e:
-            print(f"查找新文件异常: {str(e)}")
-            return None
-    
-    def _copy_video_file(self, source_path: Path, filename: str) -> Optional[str]:
-        """复制视频文件到项目目录"""
-        try:
-            import shutil
-            
-            # 目标路径
-            dest_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            
-            # 确保目录存在
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # 复制文件
-            shutil.copy2(source_path, dest_path)
-            
-            # 等待一下确保复制完成
-            import time
-            time.sleep(0.5)
-            
-            # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功复制视频: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                return str(dest_path)
-            else:
-                print(f"✗ 文件复制失败或文件为空")
-                return None
+                # 检查节点13（VHS_VideoCombine）的输出
+                if node_id == "13":
+                    video_combine_node = (node_id, node_output)
+                    logger.info("  🎬 发现视频合并节点 (Node 13)")
+                    
+                    if "gifs" in node_output:
+                        logger.info("  GIF数量: %s", len(node_output['gifs']))
+                        for i, gif_info in enumerate(node_output['gifs']):
+                            logger.info("    GIF %s: %s", i + 1, gif_info)
+                    
+                    if "videos" in node_output:
+                        logger.info("  视频数量: %s", len(node_output['videos']))
+                        for i, video_info in enumerate(node_output['videos']):
+                            logger.info("    视频 %s: %s", i + 1, video_info)
                 
-        except Exception as e:
-            print(f"复制视频文件异常: {str(e)}")
-            return None
-    
-    def _encode_image_to_base64(self, image_path: str) -> str:
-        """将图片编码为base64"""
-        try:
-            with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return encoded_string
-        except Exception as e:
-            print(f"图片编码失败: {str(e)}")
-            return ""
-        """将图片编码为base64"""
-        try:
-            with open(image_path, "rb") as image_file:
-                encoded_string = base64.b64encode(image_file.read()).decode('utf-8')
-                return encoded_string
-        except Exception as e:
-            print(f"图片编码失败: {str(e)}")
-            return ""
-    
-    def _find_latest_generated_image(self, filename: str) -> Optional[str]:
-        """从 ComfyUI 输出目录查找最新生成的图片"""
-        try:
-            import time
-            # 等待一下让ComfyUI完成文件写入
-            time.sleep(2)
-            
-            comfyui_output_dir = Path("F:/ComfyUI_windows_portable/ComfyUI/output")
-            if not comfyui_output_dir.exists():
-                print(f"✗ ComfyUI output目录不存在: {comfyui_output_dir}")
-                return None
-            
-            print(f"\n=== 查找最新生成的图片 ===")
-            print(f"搜索目录: {comfyui_output_dir}")
-            
-            # 查找所有图片文件
-            image_files = []
-            for ext in ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.webp']:
-                found_files = list(comfyui_output_dir.glob(ext))
-                image_files.extend(found_files)
-                if found_files:
-                    print(f"找到 {len(found_files)} 个 {ext} 文件")
+                elif "videos" in node_output:
+                    logger.info("  视频数量: %s", len(node_output['videos']))
+                    for i, video_info in enumerate(node_output['videos']):
+                        logger.info("    视频 %s: %s", i + 1, video_info)
+                elif "gifs" in node_output:
+                    logger.info("  GIF数量: %s", len(node_output['gifs']))
+                    for i, gif_info in enumerate(node_output['gifs']):
+                        logger.info("    GIF %s: %s", i + 1, gif_info)
+                elif "images" in node_output:
+                    logger.info("  图片数量: %s", len(node_output['images']))
+                elif "audio" in node_output:
+                    logger.info("  🎧 音频节点 (Node %s)", node_id)
+                    logger.info("  音频数量: %s", len(node_output['audio']))
+                    for i, audio_info in enumerate(node_output['audio']):
+                        logger.info("    音频 %s: %s", i + 1, audio_info)
             
-            if not image_files:
-                print(f"✗ 未找到任何图片文件")
-                return None
+            # 优先处理SaveAudioMP3节点（Node 2）的音频输出
+            save_audio_node = None
+            preview_audio_nodes = []
             
-            print(f"总共找到 {len(image_files)} 个图片文件")
+            for node_id, node_output in outputs.items():
+                if "audio" in node_output:
+                    if node_id == "2":  # SaveAudioMP3节点
+                        save_audio_node = (node_id, node_output)
+                        logger.info("🎧 发现SaveAudioMP3节点 (Node %s)", node_id)
+                    else:
+                        preview_audio_nodes.append((node_id, node_output))
+                        logger.info("🎧 发现其他音频节点 (Node %s)", node_id)
             
-            # 按修改时间排序，选择最新的
-            image_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            # 优先处理SaveAudioMP3节点的输出（这是真正的TTS生成音频）
+            if save_audio_node:
+                node_id, node_output = save_audio_node
+                logger.info("🎧 优先处理SaveAudioMP3 Node %s的audio输出...", node_id)
+                for audio_info in node_output["audio"]:
+                    logger.info("  音频文件: %s (subfolder: %s)", audio_info['filename'], audio_info.get('subfolder', 'None'))
+                    result = self._download_and_save_audio(audio_info, filename, base_url=base_url)
+                    if result:
+                        logger.info("✅ SaveAudioMP3节点音频处理成功: %s", result)
+                        return result
             
-            # 选择最新的有效图片（大于50KB）
-            for image_file in image_files[:5]:  # 只检查最新的5个文件
-                file_size = image_file.stat().st_size
-                file_time = time.ctime(image_file.stat().st_mtime)
-                print(f"检查文件: {image_file.name} ({file_size/1024:.1f}KB, {file_time})")
+            # 如果SaveAudioMP3节点失败，才处理其他音频节点
+            for node_id, node_output in preview_audio_nodes:
+                logger.info("🎧 备用方案：处理Node %s的audio输出...", node_id)
+                for audio_info in node_output["audio"]:
+                    logger.info("  音频文件: %s (subfolder: %s)", audio_info['filename'], audio_info.get('subfolder', 'None'))
+                    if audio_info.get('type') == 'temp':
+                        logger.warning("  ⚠️ 跳过临时文件，可能是参考音频: %s", audio_info['filename'])
+                        continue
+                    result = self._download_and_save_audio(audio_info, filename, base_url=base_url)
+                    if result:
+                        return result
+            if video_combine_node:
+                node_id, node_output = video_combine_node
                 
-                if file_size > 50 * 1024:  # 大于50KB
-                    print(f"✅ 选择最新的有效图片: {image_file.name}")
-                    
-                    # 复制到项目目录
-                    return self._copy_image_file(image_file, filename)
-            
-            print(f"✗ 未找到有效的图片文件（大于50KB）")
-            return None
-            
-        except Exception as e:
-            print(f"查找最新图片异常: {str(e)}")
-            return None
-    
-    def _copy_image_file(self, source_path: Path, filename: str) -> Optional[str]:
-        """复制图片文件到项目目录"""
-        try:
-            import shutil
-            
-            print(f"\n=== 复制图片文件 ===")
-            print(f"源文件: {source_path}")
-            print(f"源文件大小: {source_path.stat().st_size/1024/1024:.2f}MB")
-            
-            # 目标路径 - 使用原始扩展名
-            dest_path = Config.STORYBOARD_DIR / f"{filename}{source_path.suffix}"
-            print(f"目标路径: {dest_path}")
-            
-            # 确保目录存在
-            Config.STORYBOARD_DIR.mkdir(parents=True, exist_ok=True)
-            
-            # 复制文件
-            print(f"开始复制文件...")
-            shutil.copy2(source_path, dest_path)
-            
-            # 等待一下确保复制完成
-            import time
-            time.sleep(0.5)
-            
-            # 验证文件
-            if dest_path.exists() and dest_path.stat().st_size > 0:
-                file_size = dest_path.stat().st_size
-                print(f"✅ 成功复制图片: {dest_path}")
-                print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                print(f"=========================\n")
-                return str(dest_path)
-            else:
-                print(f"✗ 文件复制失败或文件为空")
-                return None
-                
-        except Exception as e:
-            print(f"复制图片文件异常: {str(e)}")
-            return None
-
-    def generate_videos(self, image_paths: List[str], video_prompts: List[str], video_params: Dict = None) -> List[str]:
-        """将图片转换为视频片段 - 使用分批处理避免内存溢出"""
-        video_paths = []
-        
-        print(f"开始生成 {len(image_paths)} 个视频片段...")
-        if video_params:
-            print(f"视频参数: {video_params}")
-        
-        # 检查输入参数
-        if len(image_paths) != len(video_prompts):
-            print(f"⚠️ 警告：图片数量({len(image_paths)})与提示词数量({len(video_prompts)})不匹配")
-            min_count = min(len(image_paths), len(video_prompts))
-            image_paths = image_paths[:min_count]
-            video_prompts = video_prompts[:min_count]
-            print(f"自动裁剪到 {min_count} 个")
-        
-        success_count = 0
-        
-        # 使用更小的分批处理，每批只处理1个视频以避免内存问题
-        batch_size = 1
-        max_retries = 3
-        
-        # 检查ComfyUI服务状态
-        if not self.check_connection():
-            print("❌ ComfyUI服务未运行，请先启动ComfyUI服务")
-            # 尝试恢复服务
-            if not self._attempt_service_recovery():
-                # 填充结果列表为None
-                return [None] * len(image_paths)
-        
-        # 分批处理所有视频
-        for batch_start in range(0, len(image_paths), batch_size):
-            batch_end = min(batch_start + batch_size, len(image_paths))
-            batch_images = image_paths[batch_start:batch_end]
-            batch_prompts = video_prompts[batch_start:batch_end]
-            
-            print(f"\n=== 处理批次 {batch_start//batch_size + 1}/{(len(image_paths)-1)//batch_size + 1} ===")
-            
-            # 处理当前批次
-            for i, (image_path, prompt) in enumerate(zip(batch_images, batch_prompts)):
-                try:
-                    print(f"\n--- 处理批次内第{i+1}个视频 ---")
-                    print(f"源图片: {image_path}")
-                    print(f"视频提示词: {prompt}")
-                    
-                    # 检查系统资源
-                    self._check_system_resources()
-                    
-                    # 检查图片文件是否存在
-                    if not image_path or not Path(image_path).exists():
-                        print(f"❌ 图片文件不存在，跳过: {image_path}")
-                        video_paths.append(None)
-                        continue
-                    
-                    # 生成唯一的视频文件名：图片名 + 精确时间戳
-                    image_name = Path(image_path).stem  # 不带扩展名的文件名
-                    import time as time_module  # 避免变量名冲突
-                    # 使用更精确的时间戳加随机数确保唯一性
-                    timestamp = int(time_module.time() * 1000000)  # 微秒级时间戳
-                    import uuid
-                    unique_id = str(uuid.uuid4())[:8]  # 8位随机字符
-                    video_filename = f"{image_name}_{timestamp}_{unique_id}"
-                    
-                    print(f"生成唯一视频文件名: {video_filename}")
-                    print(f"时间戳: {timestamp}, UUID前缀: {unique_id}")
-                    
-                    # 重试机制
-                    video_path = None
-                    last_error = None
-                    
-                    for retry in range(max_retries):
-                        try:
-                            # 检查ComfyUI服务状态
-                            if not self.check_connection():
-                                print("❌ ComfyUI服务连接失败")
-                                if not self._attempt_service_recovery():
-                                    last_error = "ComfyUI服务无法连接"
-                                    break
-                            
-                            if retry > 0:
-                                print(f"🔄 第{retry}次重试 (共{max_retries-1}次)...")
-                                # 重试前等待更长时间
-                                wait_time = 15 * retry  # 递增等待时间
-                                print(f"⏳ 等待 {wait_time} 秒后重试...")
-                                time_module.sleep(wait_time)
-                            
-                            # 加载视频生成工作流
-                            workflow = self.load_workflow(Config.VIDEO_WORKFLOW)
-                            
-                            # 修改工作流，传递视频参数
-                            workflow = self._update_video_workflow(workflow, image_path, prompt, video_params)
-                            
-                            # 执行工作流
-                            video_path = self._execute_workflow_simple(workflow, video_filename, timestamp)
-                            
-                            if video_path and Path(video_path).exists():
-                                # 检查文件大小
-                                file_size = Path(video_path).stat().st_size
-                                print(f"文件大小: {file_size / (1024*1024):.2f} MB")
-                                
-                                if file_size >= 1024:  # 大于1KB才认为成功
-                                    break  # 成功，跳出重试循环
-                                else:
-                                    print(f"⚠️ 警告：视频文件太小，可能生成失败")
-                                    last_error = "视频文件太小"
-                            else:
-                                last_error = "视频文件未生成"
-                                
-                        except Exception as e:
-                            last_error = str(e)
-                            print(f"❌ 生成视频片段异常 (尝试{retry+1}/{max_retries}): {str(e)}")
-                            if retry < max_retries - 1:  # 不是最后一次尝试
-                                print("等待ComfyUI服务恢复...")
-                                # 重试前等待更长时间
-                                wait_time = 20 * (retry + 1)  # 递增等待时间
-                                print(f"⏳ 等待 {wait_time} 秒后重试...")
-                                time_module.sleep(wait_time)
-                    
-                    if video_path and Path(video_path).exists():
-                        video_paths.append(video_path)
-                        success_count += 1
-                        print(f"✅ 视频片段生成成功: {video_path}")
-                    else:
-                        print(f"❌ 视频片段生成失败: {last_error}")
-                        video_paths.append(None)
-                        
-                except Exception as e:
-                    print(f"❌ 处理视频片段异常: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                    video_paths.append(None)
-                
-                # 每处理一个视频后等待一段时间，让ComfyUI释放资源
-                if i < len(batch_images) - 1:  # 不是批次内最后一个视频
-                    print("⏳ 等待ComfyUI释放资源...")
-                    time_module.sleep(5)
-                    
-                    # 强制垃圾回收
-                    gc.collect()
-            
-            # 批次间等待，让ComfyUI充分释放资源
-            if batch_end < len(image_paths):
-                print("⏳ 批次间等待，让ComfyUI充分释放资源...")
-                wait_time = 10 + (batch_start//batch_size) * 5  # 递增等待时间
-                time_module.sleep(wait_time)
-                
-                # 强制垃圾回收
-                gc.collect()
-                
-                # 检查系统资源
-                self._check_system_resources()
-                
-                # 额外的ComfyUI服务健康检查
-                if not self.check_connection():
-                    print("⚠️ ComfyUI服务连接断开，尝试重新连接...")
-                    if not self._attempt_service_recovery():
-                        print("❌ 无法重新连接到ComfyUI服务，终止视频生成")
-                        # 将剩余未处理的视频路径填充为None
-                        remaining_count = len(image_paths) - len(video_paths)
-                        video_paths.extend([None] * remaining_count)
-                        break
-        
-        print(f"\n=== 视频生成总结 ===")
-        print(f"成功生成: {success_count}/{len(image_paths)} 个视频片段")
-        
-        if success_count == 0:
-            print(f"❌ 所有视频生成失败！")
-        elif success_count < len(image_paths):
-            print(f"⚠️ 部分成功：{len(image_paths) - success_count}个视频生成失败")
-        else:
-            print(f"🎉 所有视频生成成功！")
-        
-        return video_paths
-
-    def _wait_for_completion(self, prompt_id: str, timeout: int = 900) -> Optional[Dict]:
-        """等待工作流完成 - 增加超时时间到15分钟"""
-        start_time = time.time()
-        
-        # 增加初始等待时间，让ComfyUI有时间开始处理
-        time.sleep(2)
-        
-        while time.time() - start_time < timeout:
-            try:
-                # 检查队列状态
-                response = requests.get(f"{self.base_url}/history/{prompt_id}", timeout=30)
-                
-                if response.status_code == 200:
-                    history = response.json()
-                    
-                    if prompt_id in history:
-                        # 任务完成
-                        outputs = history[prompt_id].get("outputs", {})
-                        return outputs
-                
-                # 逐渐增加等待时间，避免频繁请求
-                elapsed = time.time() - start_time
-                if elapsed < 60:
-                    time.sleep(3)  # 前1分钟每3秒检查一次
-                elif elapsed < 300:
-                    time.sleep(5)  # 1-5分钟每5秒检查一次
-                else:
-                    time.sleep(10)  # 5分钟后每10秒检查一次
-                
-            except Exception as e:
-                print(f"检查状态异常: {str(e)}")
-                time.sleep(5)
-        
-        print(f"工作流执行超时 ({timeout}秒)")
-        return None
-
-    def _save_output(self, outputs: Dict, filename: str) -> Optional[str]:
-        """保存输出文件"""
-        try:
-            print(f"\n=== 保存ComfyUI输出 ===")
-            print(f"文件名: {filename}")
-            print(f"输出节点: {list(outputs.keys())}")
-            
-            # 显示输出详情
-            video_combine_node = None  # 视频合并节点（通常是节点13）
-            
-            for node_id, node_output in outputs.items():
-                print(f"Node {node_id}: {list(node_output.keys())}")
-                
-                # 检查节点13（VHS_VideoCombine）的输出
-                if node_id == "13":
-                    video_combine_node = (node_id, node_output)
-                    print(f"  🎬 发现视频合并节点 (Node 13)")
-                    
-                    if "gifs" in node_output:
-                        print(f"  GIF数量: {len(node_output['gifs'])}")
-                        for i, gif_info in enumerate(node_output['gifs']):
-                            print(f"    GIF {i+1}: {gif_info}")
-                    
-                    if "videos" in node_output:
-                        print(f"  视频数量: {len(node_output['videos'])}")
-                        for i, video_info in enumerate(node_output['videos']):
-                            print(f"    视频 {i+1}: {video_info}")
-                
-                elif "videos" in node_output:
-                    print(f"  视频数量: {len(node_output['videos'])}")
-                    for i, video_info in enumerate(node_output['videos']):
-                        print(f"    视频 {i+1}: {video_info}")
-                elif "gifs" in node_output:
-                    print(f"  GIF数量: {len(node_output['gifs'])}")
-                    for i, gif_info in enumerate(node_output['gifs']):
-                        print(f"    GIF {i+1}: {gif_info}")
-                elif "images" in node_output:
-                    print(f"  图片数量: {len(node_output['images'])}")
-                elif "audio" in node_output:
-                    print(f"  🎧 音频节点 (Node {node_id})")
-                    print(f"  音频数量: {len(node_output['audio'])}")
-                    for i, audio_info in enumerate(node_output['audio']):
-                        print(f"    音频 {i+1}: {audio_info}")
-            
-            # 优先处理SaveAudioMP3节点（Node 2）的音频输出
-            save_audio_node = None
-            preview_audio_nodes = []
-            
-            for node_id, node_output in outputs.items():
-                if "audio" in node_output:
-                    if node_id == "2":  # SaveAudioMP3节点
-                        save_audio_node = (node_id, node_output)
-                        print(f"🎧 发现SaveAudioMP3节点 (Node {node_id})")
-                    else:
-                        preview_audio_nodes.append((node_id, node_output))
-                        print(f"🎧 发现其他音频节点 (Node {node_id})")
-            
-            # 优先处理SaveAudioMP3节点的输出（这是真正的TTS生成音频）
-            if save_audio_node:
-                node_id, node_output = save_audio_node
-                print(f"🎧 优先处理SaveAudioMP3 Node {node_id}的audio输出...")
-                for audio_info in node_output["audio"]:
-                    print(f"  音频文件: {audio_info['filename']} (subfolder: {audio_info.get('subfolder', 'None')})")
-                    result = self._download_and_save_audio(audio_info, filename)
-                    if result:
-                        print(f"✅ SaveAudioMP3节点音频处理成功: {result}")
-                        return result
-            
-            # 如果SaveAudioMP3节点失败，才处理其他音频节点
-            for node_id, node_output in preview_audio_nodes:
-                print(f"🎧 备用方案：处理Node {node_id}的audio输出...")
-                for audio_info in node_output["audio"]:
-                    print(f"  音频文件: {audio_info['filename']} (subfolder: {audio_info.get('subfolder', 'None')})")
-                    if audio_info.get('type') == 'temp':
-                        print(f"  ⚠️ 跳过临时文件，可能是参考音频: {audio_info['filename']}")
-                        continue
-                    result = self._download_and_save_audio(audio_info, filename)
-                    if result:
-                        return result
-            if video_combine_node:
-                node_id, node_output = video_combine_node
-                
-                # 先检查是否有标准的videos输出
-                if "videos" in node_output:
-                    print(f"🎬 处理Node 13的videos输出...")
-                    for video_info in node_output["videos"]:
-                        result = self._download_and_save_video(video_info, filename)
-                        if result:
-                            return result
+                # 先检查是否有标准的videos输出
+                if "videos" in node_output:
+                    logger.info("🎬 处理Node 13的videos输出...")
+                    for video_info in node_output["videos"]:
+                        result = self._download_and_save_video(video_info, filename, base_url=base_url)
+                        if result:
+                            return result
                 
                 # 如果没有videos，检查gifs（VHS_VideoCombine可能输出gif格式）
                 elif "gifs" in node_output:
-                    print(f"🎬 处理Node 13的gifs输出（可能是视频文件）...")
+                    logger.info("🎬 处理Node 13的gifs输出（可能是视频文件）...")
                     for gif_info in node_output["gifs"]:
                         # 检查文件名的扩展名
                         filename_lower = gif_info["filename"].lower()
-                        if filename_lower.endswith(('.mp4', '.avi', '.mov', '.mkv')):
-                            print(f"✅ 检测到视频格式: {gif_info['filename']}")
-                            result = self._download_and_save_video(gif_info, filename, is_video=True)
+                        if os.path.splitext(filename_lower)[1] in _VIDEO_EXTS:
+                            logger.info("✅ 检测到视频格式: %s", gif_info['filename'])
+                            result = self._download_and_save_video(gif_info, filename, is_video=True, base_url=base_url)
                         else:
-                            print(f"⚠️ 检测到GIF格式: {gif_info['filename']}")
-                            result = self._download_and_convert_gif(gif_info, filename)
+                            logger.warning("⚠️ 检测到GIF格式: %s", gif_info['filename'])
+                            result = self._download_and_convert_gif(gif_info, filename, base_url=base_url)
                         
-                        if result:
-                            return result
-            
-            # 处理其他节点的视频输出
-            for node_id, node_output in outputs.items():
-                if node_id != "13" and "videos" in node_output:
-                    print(f"🎬 处理Node {node_id}的videos输出...")
-                    for video_info in node_output["videos"]:
-                        result = self._download_and_save_video(video_info, filename)
-                        if result:
-                            return result
-            
-            print(f"❌ 无法通过API下载任何文件")
-            return None
-            
-        except Exception as e:
-            print(f"保存文件异常: {str(e)}")
-            return None
-    
-    def _download_and_save_video(self, video_info: Dict, filename: str, is_video: bool = True) -> Optional[str]:
-        """下载并保存视频文件"""
-        try:
-            video_url = f"{self.base_url}/view"
-            params = {
-                "filename": video_info["filename"],
-                "subfolder": video_info.get("subfolder", ""),
-                "type": video_info.get("type", "output")
-            }
-            
-            print(f"尝试下载{'视频' if is_video else 'GIF'}: {video_info['filename']}")
-            response = requests.get(video_url, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                # 直接保存为MP4格式
-                save_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-                Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-                
-                with open(save_path, "wb") as f:
-                    f.write(response.content)
-                
-                # 验证文件
-                if save_path.exists() and save_path.stat().st_size > 0:
-                    file_size = save_path.stat().st_size
-                    print(f"✅ {'视频' if is_video else 'GIF'}下载成功: {save_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    return str(save_path)
-                else:
-                    print(f"✗ 下载的文件为空或不存在")
-            else:
-                print(f"✗ 下载失败: HTTP {response.status_code}")
-            
-            return None
-            
-        except Exception as e:
-            print(f"下载文件异常: {str(e)}")
-            return None
-    
-    def _download_and_convert_gif(self, gif_info: Dict, filename: str) -> Optional[str]:
-        """下载GIF并转换为MP4"""
-        try:
-            gif_url = f"{self.base_url}/view"
-            params = {
-                "filename": gif_info["filename"],
-                "subfolder": gif_info.get("subfolder", ""),
-                "type": gif_info.get("type", "output")
-            }
-            
-            print(f"尝试下载GIF: {gif_info['filename']}")
-            response = requests.get(gif_url, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                # 先保存GIF文件
-                temp_gif_path = Config.TEMP_DIR / f"temp_{filename}.gif"
-                Config.TEMP_DIR.mkdir(parents=True, exist_ok=True)
-                
-                with open(temp_gif_path, "wb") as f:
-                    f.write(response.content)
-                
-                print(f"✅ GIF下载成功: {temp_gif_path}")
-                
-                # 尝试转换为MP4
-                return self._convert_gif_to_mp4(temp_gif_path, filename)
-            else:
-                print(f"✗ GIF下载失败: HTTP {response.status_code}")
-            
-            return None
-            
-        except Exception as e:
-            print(f"下载GIF异常: {str(e)}")
-            return None
-    
-    def _download_and_save_audio(self, audio_info: Dict, filename: str) -> Optional[str]:
-        """下载并保存音频文件"""
-        try:
-            audio_url = f"{self.base_url}/view"
-            params = {
-                "filename": audio_info["filename"],
-                "subfolder": audio_info.get("subfolder", ""),
-                "type": audio_info.get("type", "output")
-            }
-            
-            print(f"尝试下载音频: {audio_info['filename']}")
-            response = requests.get(audio_url, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                # 保存为音频文件
-                save_path = Config.AUDIO_DIR / f"{filename}.wav"
-                Config.AUDIO_DIR.mkdir(parents=True, exist_ok=True)
-                
-                with open(save_path, "wb") as f:
-                    f.write(response.content)
-                
-                # 验证文件
-                if save_path.exists() and save_path.stat().st_size > 0:
-                    file_size = save_path.stat().st_size
-                    print(f"✅ 音频下载成功: {save_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    return str(save_path)
-                else:
-                    print(f"✗ 下载的文件为空或不存在")
-            else:
-                print(f"✗ 下载失败: HTTP {response.status_code}")
-            
-            return None
-            
-        except Exception as e:
-            print(f"下载音频异常: {str(e)}")
-            return None
-    
-    def _convert_gif_to_mp4(self, gif_path: Path, filename: str) -> Optional[str]:
-        """将GIF转换为MP4视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将GIF转换为MP4...")
-            print(f"源文件: {gif_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg转换GIF为MP4
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-i', str(gif_path),  # 输入GIF文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                '-crf', '19',  # 质量参数
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ GIF转MP4成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时GIF文件
-                    try:
-                        gif_path.unlink()
-                        print(f"✅ 清理临时GIF文件: {gif_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-                
-                # 如果FFmpeg失败，尝试直接重命名GIF为MP4（作为备用方案）
-                print(f"⚠️ 尝试备用方案：直接重命名GIF为MP4...")
-                try:
-                    import shutil
-                    shutil.copy2(gif_path, output_path)
-                    if output_path.exists():
-                        print(f"✅ 备用方案成功: {output_path}")
-                        return str(output_path)
-                except Exception as e:
-                    print(f"✗ 备用方案也失败: {str(e)}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg，尝试备用方案...")
-            # 备用方案：直接复制文件
-            try:
-                import shutil
-                output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-                shutil.copy2(gif_path, output_path)
-                if output_path.exists():
-                    print(f"✅ 备用方案复制成功: {output_path}")
-                    return str(output_path)
-            except Exception as e:
-                print(f"✗ 备用方案复制失败: {str(e)}")
-            return None
-        except Exception as e:
-            print(f"转GIF为MP4异常: {str(e)}")
-            return None
-    
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+                        if result:
+                            return result
             
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+            # 处理其他节点的视频输出
+            for node_id, node_output in outputs.items():
+                if node_id != "13" and "videos" in node_output:
+                    logger.info("🎬 处理Node %s的videos输出...", node_id)
+                    for video_info in node_output["videos"]:
+                        result = self._download_and_save_video(video_info, filename, base_url=base_url)
+                        if result:
+                            return result
             
+            logger.error("❌ 无法通过API下载任何文件")
             return None
             
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
+        except Exception as e:
+            logger.error("保存文件异常: %s", e)
             return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
+    
+    def _local_output_file(self, file_info: Dict, base_url: str) -> Optional[Path]:
+        """本机ComfyUI的output文件返回其本地路径，远程后端或文件不存在时返回None"""
+        if base_url != self.base_url or file_info.get("type", "output") != "output":
             return None
+        src = self._comfyui_output_dir / file_info.get("subfolder", "") / file_info["filename"]
+        return src if src.is_file() else None
+    
+    def _link_or_copy(self, src: Path, dest: Path):
+        """同一分区时硬链接（不复制数据），跨分区或文件系统不支持时回退到复制"""
+        if dest.exists():
+            dest.unlink()
+        try:
+            os.link(src, dest)
+        except OSError:
+            # copyfile走系统的快速拷贝（Windows上CopyFileExW，Linux上sendfile），下游不需要保留元数据
+            shutil.copyfile(src, dest)
+    
+    def _download_view_file(self, url: str, params: Dict, save_path: Path, parts: int = 4,
+                            min_range_size: int = 4 << 20) -> int:
+        """把/view返回的文件下载到save_path，返回HTTP状态码；大文件且服务端支持Range时分段并行下载"""
+        try:
+            head = self.session.head(url, params=params, timeout=10)
+            size = int(head.headers.get('Content-Length', 0))
+            if head.status_code == 200 and head.headers.get('Accept-Ranges') == 'bytes' and size >= min_range_size:
+                self._download_ranges(url, params, save_path, size, parts)
+                return 200
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
+            logger.warning("⚠️ 分段下载失败，改为整体下载: %s", e)
+        
+        response = self.session.get(url, params=params, timeout=(10, 300), stream=True)
+        if response.status_code != 200:
+            response.close()
+            return response.status_code
+        _stream_response_to_file(response, save_path)
+        return 200
+    
+    def _download_ranges(self, url: str, params: Dict, save_path: Path, size: int, parts: int):
+        """按字节范围把文件分成parts段并行下载，各线程写入预分配文件的对应位置"""
+        _detach_output(save_path)
+        with open(save_path, 'wb') as f:
+            f.truncate(size)
+        step = -(-size // parts)
+        
+        def fetch(start: int):
+            end = min(start + step, size) - 1
+            headers = {'Range': f'bytes={start}-{end}'}
+            written = 0
+            with self.session.get(url, params=params, headers=headers, timeout=(10, 300), stream=True) as response:
+                if response.status_code != 206:
+                    raise IOError(f"Range请求返回HTTP {response.status_code}")
+                with open(save_path, 'r+b') as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(1 << 20):
+                        f.write(chunk)
+                        written += len(chunk)
+            if written != end - start + 1:
+                raise IOError(f"分段 {start}-{end} 不完整")
+        
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            list(executor.map(fetch, range(0, size, step)))
+    
+    def _download_and_save_video(self, video_info: Dict, filename: str, is_video: bool = True, base_url: Optional[str] = None) -> Optional[str]:
+        """下载并保存视频文件"""
+        base_url = base_url or self.base_url
         try:
-            import subprocess
+            video_url = f"{base_url}/view"
+            params = {
+                "filename": video_info["filename"],
+                "subfolder": video_info.get("subfolder", ""),
+                "type": video_info.get("type", "output")
+            }
             
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            # 本机ComfyUI的输出文件已在磁盘上，直接硬链接或复制，不走HTTP下载
+            local_src = self._local_output_file(video_info, base_url)
+            if local_src:
+                save_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
+                self._link_or_copy(local_src, save_path)
+                logger.info("✅ 直接使用本地输出文件: %s -> %s", local_src, save_path)
+                return str(save_path)
             
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
+            logger.info("尝试下载%s: %s", '视频' if is_video else 'GIF', video_info['filename'])
+            # 直接保存为MP4格式
+            save_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
+            status = self._download_view_file(video_url, params, save_path)
+            
+            if status == 200:
+                
+                # 验证文件
+                st = _stat_or_none(save_path)
+                if st and st.st_size > 0:
+                    file_size = st.st_size
+                    logger.info("✅ %s下载成功: %s", '视频' if is_video else 'GIF', save_path)
+                    logger.info("文件大小: %.2fMB", file_size * _MB)
+                    return str(save_path)
                 else:
-                    print(f"✗ 转换后的文件为空或不存在")
+                    logger.warning("✗ 下载的文件为空或不存在")
             else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+                logger.warning("✗ 下载失败: HTTP %s", status)
             
             return None
             
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
+            logger.error("下载文件异常: %s", e)
             return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
+    
+    def _download_and_convert_gif(self, gif_info: Dict, filename: str, base_url: Optional[str] = None) -> Optional[str]:
+        """下载GIF并转换为MP4"""
+        base_url = base_url or self.base_url
         try:
-            import subprocess
+            gif_url = f"{base_url}/view"
+            params = {
+                "filename": gif_info["filename"],
+                "subfolder": gif_info.get("subfolder", ""),
+                "type": gif_info.get("type", "output")
+            }
             
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            # 本机输出直接链接到临时目录再转换（转换成功后会删除临时GIF，不能直接传源文件）
+            local_src = self._local_output_file(gif_info, base_url)
+            if local_src:
+                temp_gif_path = Config.TEMP_DIR / f"temp_{filename}.gif"
+                self._link_or_copy(local_src, temp_gif_path)
+                logger.info("✅ 直接使用本地GIF文件: %s", local_src)
+                return self._convert_gif_to_mp4(temp_gif_path, filename)
             
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
+            logger.info("尝试下载GIF: %s", gif_info['filename'])
+            # 先保存GIF文件
+            temp_gif_path = Config.TEMP_DIR / f"temp_{filename}.gif"
+            status = self._download_view_file(gif_url, params, temp_gif_path)
+            
+            if status == 200:
+                
+                logger.info("✅ GIF下载成功: %s", temp_gif_path)
+                
+                # 尝试转换为MP4
+                return self._convert_gif_to_mp4(temp_gif_path, filename)
             else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+                logger.warning("✗ GIF下载失败: HTTP %s", status)
             
             return None
             
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
+            logger.error("下载GIF异常: %s", e)
             return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
+    
+    def _download_and_save_audio(self, audio_info: Dict, filename: str, base_url: Optional[str] = None) -> Optional[str]:
+        """下载并保存音频文件"""
+        base_url = base_url or self.base_url
         try:
-            import subprocess
+            audio_url = f"{base_url}/view"
+            params = {
+                "filename": audio_info["filename"],
+                "subfolder": audio_info.get("subfolder", ""),
+                "type": audio_info.get("type", "output")
+            }
             
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            local_src = self._local_output_file(audio_info, base_url)
+            if local_src:
+                save_path = Config.AUDIO_DIR / f"{filename}.wav"
+                self._link_or_copy(local_src, save_path)
+                logger.info("✅ 直接使用本地音频文件: %s -> %s", local_src, save_path)
+                return str(save_path)
             
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
+            logger.info("尝试下载音频: %s", audio_info['filename'])
+            # 保存为音频文件
+            save_path = Config.AUDIO_DIR / f"{filename}.wav"
+            status = self._download_view_file(audio_url, params, save_path)
+            
+            if status == 200:
+                
+                # 验证文件
+                st = _stat_or_none(save_path)
+                if st and st.st_size > 0:
+                    file_size = st.st_size
+                    logger.info("✅ 音频下载成功: %s", save_path)
+                    logger.info("文件大小: %.2fMB", file_size * _MB)
+                    return str(save_path)
                 else:
-                    print(f"✗ 转换后的文件为空或不存在")
+                    logger.warning("✗ 下载的文件为空或不存在")
             else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+                logger.warning("✗ 下载失败: HTTP %s", status)
             
             return None
             
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
+            logger.error("下载音频异常: %s", e)
             return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
+    
+    def _run_ffmpeg(self, cmd: List[str], timeout: float = 60) -> subprocess.CompletedProcess:
+        """运行FFmpeg命令，同时运行的进程数不超过CPU核心数（多个后端的工作线程可并发转码）"""
+        with _ffmpeg_slots:
+            # 只在失败时需要stderr，stdout直接丢弃，不做文本解码
+            return subprocess.run(_FFMPEG_NICE_PREFIX + cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout)
+    
+    def _convert_still_gif(self, gif_path: Path, filename: str) -> Optional[str]:
+        """单帧GIF按静态图片转换为视频；不是单帧GIF、Pillow无法识别（如保存为.gif的webm）或转换失败时返回None"""
+        png_path = gif_path.with_suffix('.png')
         try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
+            with Image.open(gif_path) as img:
+                if getattr(img, 'n_frames', 1) != 1:
+                    return None
+                img.convert('RGB').save(png_path)
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
+            logger.debug("无法按图片读取 %s，改用FFmpeg转换: %s", gif_path, e)
+            png_path.unlink(missing_ok=True)
             return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
+        
+        logger.info("检测到单帧GIF，按静态图片转换为视频: %s", gif_path)
+        result = self._convert_image_to_video(png_path, filename)
+        if not result:
+            logger.warning("⚠️ 单帧GIF按图片转换失败，改用FFmpeg转换")
+            png_path.unlink(missing_ok=True)
+        return result
+    
+    def _convert_gif_to_mp4(self, gif_path: Path, filename: str) -> Optional[str]:
+        """将GIF转换为MP4视频"""
         try:
-            import subprocess
-            
             output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
             
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+            # 单帧GIF（静态预览图）直接走图片转视频，省去GIF解码和滤镜初始化；其他情况都交给FFmpeg命令
+            if Image is not None:
+                result = self._convert_still_gif(gif_path, filename)
+                if result:
+                    _cleanup_executor.submit(_remove_temp_file, gif_path)
+                    return result
             
-            return None
+            logger.debug("尝试使用FFmpeg将GIF转换为MP4...")
+            logger.debug("源文件: %s", gif_path)
+            logger.debug("目标文件: %s", output_path)
             
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
+            # 使用FFmpeg转换GIF为MP4
+            head, tail = self._gif_cmd_template
+            cmd = [*head, str(gif_path), *tail, str(output_path)]
             
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            _detach_output(output_path)
+            result = self._run_ffmpeg(cmd, timeout=60)
             
             if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
+                st = _stat_or_none(output_path)
+                if st and st.st_size > 0:
+                    file_size = st.st_size
+                    logger.info("✅ GIF转MP4成功: %s", output_path)
+                    logger.debug("文件大小: %.2fMB", file_size * _MB)
                     
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
+                    # 清理临时GIF文件
+                    _cleanup_executor.submit(_remove_temp_file, gif_path)
                     
                     return str(output_path)
                 else:
-                    print(f"✗ 转换后的文件为空或不存在")
+                    logger.warning("✗ 转换后的文件为空或不存在")
             else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+                logger.warning("✗ FFmpeg转换失败")
+                logger.info("错误信息: %s", result.stderr[-4096:].decode('utf-8', errors='replace'))
+                
+                # 如果FFmpeg失败，使用备用方案
+                return self._convert_gif_fallback(gif_path, output_path)
             
             return None
             
         except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
+            logger.warning("✗ FFmpeg转换超时")
             return None
         except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
+            logger.warning("✗ 找不到FFmpeg，尝试备用方案...")
+            return self._convert_gif_fallback(gif_path, Config.VIDEO_CLIPS_DIR / f"{filename}.mp4")
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
+            logger.error("转GIF为MP4异常: %s", e)
             return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
+    
+    def _convert_gif_fallback(self, gif_path: Path, output_path: Path) -> Optional[str]:
+        """FFmpeg命令行转换失败时的备用方案：优先用PyAV在进程内转码，否则直接复制GIF为MP4"""
+        _detach_output(output_path)
+        if av is not None:
+            logger.warning("⚠️ 尝试备用方案：使用PyAV转码GIF为MP4...")
+            try:
+                self._transcode_gif_with_pyav(gif_path, output_path)
+                st = _stat_or_none(output_path)
+                if st and st.st_size > 0:
+                    logger.info("✅ 备用方案成功: %s", output_path)
                     return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
+            except Exception as e:
+                logger.warning("✗ PyAV转码失败: %s", e)
+        
+        # GIF不能直接封装进MP4容器，只能原样复制（依赖下游按内容而非扩展名识别格式）
+        logger.warning("⚠️ 尝试备用方案：直接复制GIF为MP4...")
+        try:
+            shutil.copy2(gif_path, output_path)
+            if output_path.exists():
+                logger.info("✅ 备用方案复制成功: %s", output_path)
+                return str(output_path)
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
+            logger.warning("✗ 备用方案复制失败: %s", e)
+        return None
+    
+    def _transcode_gif_with_pyav(self, gif_path: Path, output_path: Path, fps: int = 18):
+        """用PyAV在进程内把GIF解码后编码为H.264/yuv420p的MP4，不启动FFmpeg子进程；与命令行的-r一样按时间戳重采样到fps帧率"""
+        with av.open(str(gif_path)) as input_container, av.open(str(output_path), 'w') as output_container:
+            in_stream = input_container.streams.video[0]
+            # yuv420p要求宽高为偶数
+            width = in_stream.codec_context.width // 2 * 2
+            height = in_stream.codec_context.height // 2 * 2
+            out_stream = output_container.add_stream('libx264', rate=fps)
+            out_stream.width = width
+            out_stream.height = height
+            out_stream.pix_fmt = 'yuv420p'
+            
+            next_pts = 0
+            
+            def emit(out_frame, until: int):
+                """重复编码out_frame，填满输出帧序号until之前的位置（帧率高于fps时部分输入帧不会被输出）"""
+                nonlocal next_pts
+                while next_pts < until:
+                    out_frame.pts = next_pts
+                    for packet in out_stream.encode(out_frame):
+                        output_container.mux(packet)
+                    next_pts += 1
+            
+            # 每个输入帧显示到下一帧开始为止，按各帧的实际时间戳换算到输出帧序号
+            previous = None
+            start = last_time = None
+            last_duration = 1 / fps
+            for frame in input_container.decode(in_stream):
+                frame_time = frame.time if frame.time is not None else (last_time + last_duration if last_time is not None else 0.0)
+                if start is None:
+                    start = frame_time
+                if previous is not None:
+                    emit(previous, round((frame_time - start) * fps))
+                    last_duration = max(frame_time - last_time, 1 / fps)
+                if getattr(frame, 'duration', None) and frame.time_base:
+                    last_duration = float(frame.duration * frame.time_base)
+                previous = frame.reformat(width=width, height=height, format='yuv420p')
+                previous.time_base = Fraction(1, fps)
+                last_time = frame_time
+            # 最后一帧按它自身的显示时长输出，至少输出一帧
+            if previous is not None:
+                emit(previous, max(round((last_time + last_duration - start) * fps), next_pts + 1))
+            # 刷出编码器中缓存的帧
+            for packet in out_stream.encode():
+                output_container.mux(packet)
+    
+    def _encode_image_with_pyav(self, image_path: Path, output_path: Path, fps: int = 18, seconds: int = 5,
+                                threads: int = 0):
+        """用PyAV在进程内把静态图片编码为H.264/yuv420p的MP4（参数与FFmpeg命令一致），不启动子进程；threads为0时自动选择线程数"""
+        with av.open(str(image_path)) as input_container:
+            frame = next(input_container.decode(video=0))
+        # yuv420p要求宽高为偶数
+        width = frame.width // 2 * 2
+        height = frame.height // 2 * 2
+        frame = frame.reformat(width=width, height=height, format='yuv420p')
+        frame.time_base = Fraction(1, fps)
+        # 图片解码出的帧标记为I帧，原样送入会让编码器把每一帧都编成I帧
+        frame.pict_type = av.video.frame.PictureType.NONE
+        
+        with av.open(str(output_path), 'w') as output_container:
+            out_stream = output_container.add_stream('libx264', rate=fps)
+            out_stream.width = width
+            out_stream.height = height
+            out_stream.pix_fmt = 'yuv420p'
+            # zerolatency让首帧立即输出，便于取得其重建帧
+            out_stream.options = {'preset': Config.X264_PRESET, 'tune': 'stillimage,zerolatency'}
+            out_stream.codec_context.thread_count = threads
+            
+            frame.pts = 0
+            packets = out_stream.encode(frame)
+            # 后续帧改为送入首帧解码后的重建帧：与参考帧完全相同，x264全部编码为跳过块，
+            # 省去每帧反复补偿量化误差的编码量（输出体积约为直接重复原图的十分之一）
+            reference = self._decode_first_frame(out_stream, packets) or frame
+            reference.time_base = Fraction(1, fps)
+            for packet in packets:
+                output_container.mux(packet)
+            
+            for index in range(1, fps * seconds):
+                reference.pts = index
+                for packet in out_stream.encode(reference):
+                    output_container.mux(packet)
+            # 刷出编码器中缓存的帧
+            for packet in out_stream.encode():
+                output_container.mux(packet)
+    
+    def _decode_first_frame(self, out_stream, packets):
+        """解码编码器输出的首帧数据包，返回与编码器参考帧一致的重建帧，失败时返回None"""
         try:
-            import subprocess
-            
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
+            decoder = av.CodecContext.create('h264', 'r')
+            decoder.extradata = out_stream.codec_context.extradata
+            frames = [decoded for packet in packets for decoded in decoder.decode(packet)]
+            frames += decoder.decode(None)
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
+            logger.debug("解码首帧失败，重复原图编码: %s", e)
             return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
+        if not frames:
+            return None
+        reference = frames[0]
+        reference.pict_type = av.video.frame.PictureType.NONE
+        return reference
+    
+    def _convert_image_to_video(self, image_path: Path, filename: str, threads: int = 0,
+                                delete_source: bool = True) -> Optional[str]:
+        """将静态图片转换为视频；threads为编码线程数，0表示由编码器按CPU核心数自动选择；delete_source为True时成功后删除源图片（内部临时文件）"""
         try:
-            import subprocess
-            
             output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            head, tail = self._image_cmd_template
             
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
-            else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+            # 先确认源文件存在，避免之后的FileNotFoundError被当成找不到FFmpeg
+            if _stat_or_none(image_path) is None:
+                logger.warning("✗ 源文件不存在: %s", image_path)
+                return None
             
-            return None
+            # 输入本身已经是视频时不再编码：MP4直接链接，其他容器只做封装转换
+            container = _sniff_video_container(image_path)
+            if container == 'mp4':
+                self._link_or_copy(image_path, output_path)
+                logger.info("✅ 输入已是MP4视频，直接使用: %s", output_path)
+                return str(output_path)
+            if container:
+                # 先封装到临时文件再重命名；失败时不再按静态图片编码（那只会得到首帧的5秒视频）
+                part_path = output_path.with_name(f"{filename}.part.mp4")
+                cmd = [_FFMPEG_BIN, '-y', '-loglevel', 'error', '-nostats', '-i', str(image_path), '-c', 'copy', str(part_path)]
+                if self._run_ffmpeg(cmd, timeout=60).returncode == 0:
+                    os.replace(part_path, output_path)
+                    logger.info("✅ 输入已是%s视频，已转封装为MP4: %s", container.upper(), output_path)
+                    return str(output_path)
+                part_path.unlink(missing_ok=True)
+                logger.warning("✗ %s视频转封装失败: %s", container.upper(), image_path)
+                return None
             
-        except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
-            return None
-        except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
-            return None
-        except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
-
-    def _convert_image_to_video(self, image_path: Path, filename: str) -> Optional[str]:
-        """将静态图片转换为视频"""
-        try:
-            import subprocess
+            # 相同图片（重试节点时常见）直接复用之前的转换结果；编码参数也计入哈希
+            # 缓存用复制而非硬链接，避免之后覆盖写输出文件时改坏缓存
+            cache_path = Config.IMAGE_CLIP_CACHE_DIR / f"{_file_digest(image_path, ' '.join(tail).encode())}.mp4"
+            cache_st = _stat_or_none(cache_path)
+            if cache_st and cache_st.st_size > 0:
+                _detach_output(output_path)
+                shutil.copyfile(cache_path, output_path)
+                # 命中时更新修改时间，淘汰缓存时按它判断最近使用
+                try:
+                    os.utime(cache_path)
+                except OSError:
+                    pass
+                logger.info("✅ 复用相同图片的转换结果: %s", output_path)
+                if delete_source:
+                    _cleanup_executor.submit(_remove_temp_file, image_path)
+                return str(output_path)
             
-            output_path = Config.VIDEO_CLIPS_DIR / f"{filename}.mp4"
-            Config.VIDEO_CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-            
-            print(f"尝试使用FFmpeg将图片转换为视频...")
-            print(f"源文件: {image_path}")
-            print(f"目标文件: {output_path}")
-            
-            # 使用FFmpeg将静态图片转换为视频
-            cmd = [
-                'ffmpeg', '-y',  # -y 覆盖输出文件
-                '-loop', '1',  # 循环播放图片
-                '-i', str(image_path),  # 输入图片文件
-                '-c:v', 'libx264',  # 使用H.264编码
-                '-t', '5',  # 视频时长5秒
-                '-pix_fmt', 'yuv420p',  # 像素格式
-                '-r', '18',  # 帧率
-                str(output_path)
-            ]
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
+            logger.debug("源文件: %s", image_path)
+            logger.debug("目标文件: %s", output_path)
             
-            if result.returncode == 0:
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    file_size = output_path.stat().st_size
-                    print(f"✅ 图片转视频成功: {output_path}")
-                    print(f"文件大小: {file_size/1024/1024:.2f}MB")
-                    
-                    # 清理临时图片文件
-                    try:
-                        image_path.unlink()
-                        print(f"✅ 清理临时图片文件: {image_path}")
-                    except Exception as e:
-                        print(f"⚠️ 清理临时文件失败: {str(e)}")
-                    
-                    return str(output_path)
-                else:
-                    print(f"✗ 转换后的文件为空或不存在")
+            # 先写入临时文件，编码成功后原子重命名；失败或中断时不会留下不完整的输出文件
+            part_path = output_path.with_name(f"{filename}.part.mp4")
+            try:
+                # 安装了PyAV且选用的是libx264时在进程内编码，省去每张图片启动FFmpeg子进程的开销；失败再走FFmpeg命令行
+                # 探测到硬件编码器时直接走FFmpeg命令模板，由硬件编码器完成编码
+                encoded = False
+                if av is not None and _h264_encoder_args()[1] == 'libx264':
+                    try:
+                        self._encode_image_with_pyav(image_path, part_path, threads=threads)
+                        encoded = True
+                    except Exception as e:
+                        logger.warning("⚠️ PyAV编码失败，改用FFmpeg: %s", e)
+                
+                if not encoded:
+                    # 使用FFmpeg将静态图片转换为视频
+                    logger.debug("尝试使用FFmpeg将图片转换为视频...")
+                    # 指定线程数时追加-threads，覆盖模板中的-threads 0
+                    thread_args = ('-threads', str(threads)) if threads else ()
+                    cmd = [*head, str(image_path), *tail, *thread_args, str(part_path)]
+                    result = self._run_ffmpeg(cmd, timeout=60)
+                    if result.returncode != 0:
+                        logger.warning("✗ FFmpeg转换失败")
+                        logger.info("错误信息: %s", result.stderr[-4096:].decode('utf-8', errors='replace'))
+                        part_path.unlink(missing_ok=True)
+                        return None
+                
+                os.replace(part_path, output_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+            
+            logger.info("✅ 图片转视频成功: %s", output_path)
+            
+            # 先写临时文件再重命名，并行转换时其他线程不会读到写了一半的缓存；写入后按上限淘汰旧缓存
+            cache_part = cache_path.with_name(f"{cache_path.stem}.{threading.get_ident()}.part")
+            try:
+                shutil.copyfile(output_path, cache_part)
+                os.replace(cache_part, cache_path)
+            except OSError as e:
+                logger.warning("⚠️ 写入转换缓存失败: %s", e)
+                cache_part.unlink(missing_ok=True)
             else:
-                print(f"✗ FFmpeg转换失败")
-                print(f"错误信息: {result.stderr}")
+                _cleanup_executor.submit(_prune_clip_cache, Config.IMAGE_CLIP_CACHE_DIR,
+                                         Config.IMAGE_CLIP_CACHE_MAX_FILES, Config.IMAGE_CLIP_CACHE_MAX_MB << 20)
             
-            return None
+            # 清理临时图片文件
+            if delete_source:
+                _cleanup_executor.submit(_remove_temp_file, image_path)
+            
+            return str(output_path)
             
         except subprocess.TimeoutExpired:
-            print(f"✗ FFmpeg转换超时")
+            logger.warning("✗ FFmpeg转换超时")
             return None
         except FileNotFoundError:
-            print(f"✗ 找不到FFmpeg")
+            logger.warning("✗ 找不到FFmpeg")
             return None
         except Exception as e:
-            print(f"图片转视频异常: {str(e)}")
-            return None
\ No newline at end of file
+            logger.error("图片转视频异常: %s", e)
+            return None
+    
+    def batch_convert_images_to_video(self, items: List[tuple], delete_source: bool = False) -> List[Optional[str]]:
+        """并行把多张图片转换为视频，items为[(图片路径, 文件名)]，按顺序返回视频路径（失败为None）；默认保留源图片"""
+        if not items:
+            return []
+        # 编码在FFmpeg子进程或PyAV/x264的C代码中进行，线程主要在等待；同时运行的FFmpeg数由_ffmpeg_slots限制
+        # 多张并行时每个编码器只用单线程，由外层并行占满CPU，避免每个编码器再按核心数开线程造成过度订阅
+        threads = 1 if len(items) > 1 else 0
+        with ThreadPoolExecutor(max_workers=min(len(items), os.cpu_count() or 4)) as executor:
+            return list(executor.map(lambda item: self._convert_image_to_video(*item, threads=threads, delete_source=delete_source), items))
+    
+    def submit_image_to_video(self, image_path: Path, filename: str, delete_source: bool = False) -> str:
+        """在后台线程中把图片转换为视频，立即返回任务ID，用get_encode_status查询进度；默认保留源图片"""
+        job_id = uuid.uuid4().hex
+        future = _encode_executor.submit(self._convert_image_to_video, image_path, filename,
+                                         delete_source=delete_source)
+        with _encode_jobs_lock:
+            _prune_encode_jobs()
+            _encode_jobs[job_id] = future
+        future.add_done_callback(lambda _: _mark_encode_job_done(job_id))
+        return job_id
+    
+    def get_encode_status(self, job_id: str) -> Dict:
+        """查询后台转换任务状态: {'status': 'running'|'done'|'error'|'unknown', 'output': 视频路径或None}；完成后的结果可在一段时间内重复查询"""
+        with _encode_jobs_lock:
+            _prune_encode_jobs()
+            future = _encode_jobs.get(job_id)
+        if future is None:
+            return {'status': 'unknown', 'output': None}
+        if not future.done():
+            return {'status': 'running', 'output': None}
+        
+        output = None if future.exception() else future.result()
+        return {'status': 'done' if output else 'error', 'output': output}
\ No newline at end of file
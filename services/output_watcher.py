@@ -0,0 +1,92 @@
+import logging
+import threading
+import time
+from pathlib import Path
+
+# watchdog为可选依赖，未安装时退回到固定时长等待
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+logger = logging.getLogger(__name__)
+
+
+class OutputDirWatcher(FileSystemEventHandler):
+    """监听ComfyUI output目录的文件写入事件，用来代替"等待文件写完"的固定sleep"""
+
+    def __init__(self, directory: Path):
+        super().__init__()
+        self._directory = directory
+        self._cond = threading.Condition()
+        self._last_event = time.monotonic()
+        self._observer = None
+        self._start_failed = False
+        with self._cond:
+            self._try_start()
+
+    def _try_start(self):
+        """目录存在时启动监听线程（调用方需持有_cond）；目录尚未创建或启动失败时，之后每次等待前重试"""
+        if Observer is None or self._observer is not None or not self._directory.exists():
+            return
+        try:
+            observer = Observer()
+            observer.schedule(self, str(self._directory), recursive=True)
+            observer.daemon = True
+            observer.start()
+        except Exception as e:
+            # 只在第一次失败时警告，之后的重试失败不再刷屏
+            log = logger.debug if self._start_failed else logger.warning
+            log("无法监听ComfyUI输出目录，使用固定等待: %s", e)
+            self._start_failed = True
+            return
+        self._observer = observer
+        # 刚开始监听时看不到之前的写入，按"刚有写入"处理，首次等待至少quiet秒
+        self._last_event = time.monotonic()
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        with self._cond:
+            self._last_event = time.monotonic()
+            self._cond.notify_all()
+
+    def wait_quiet(self, quiet: float = 1.0, timeout: float = 5.0):
+        """等待目录连续quiet秒没有写入事件（文件已写完），最多等待timeout秒"""
+        with self._cond:
+            self._try_start()
+            observing = self._observer is not None
+        if not observing:
+            time.sleep(timeout)
+            return
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                idle = now - self._last_event
+                if idle >= quiet or now >= deadline:
+                    return
+                self._cond.wait(min(quiet - idle, deadline - now))
+
+    def stop(self):
+        """停止监听线程"""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+
+_watchers = {}
+_watchers_lock = threading.Lock()
+
+
+def get_output_watcher(directory: Path) -> OutputDirWatcher:
+    """返回目录对应的进程级共享监听器，首次使用时才启动，避免每个服务实例各开一个监听线程"""
+    key = str(directory)
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = _watchers[key] = OutputDirWatcher(directory)
+        return watcher